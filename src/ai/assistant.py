@@ -4,22 +4,35 @@ Generates SQL queries from natural language prompts
 """
 
 import os
+import re
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import timedelta
 from typing import Dict, List, Optional, Any
 import logging
 import google.generativeai as genai
 from dotenv import load_dotenv
-import sys
-from pathlib import Path
 
-# Add parent directory to path for config import
-sys.path.append(str(Path(__file__).parent.parent))
 from config import Config
+from utils.helpers import get_app_config_dir, safe_json_load, safe_json_save, validate_sql_syntax
 
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Generated queries kept across launches, keyed by schema and request
+AI_CACHE_FILE = get_app_config_dir() / "ai_query_cache.json"
+
+# Requests that refer back to earlier turns ("sort it by date", "same but for
+# orders"); their SQL depends on the conversation, so they bypass the cache
+_FOLLOW_UP_PATTERN = re.compile(
+    r"\b(?:it|its|them|they|those|these|same|previous|above|instead|also|again"
+    r"|that (?:one|query|result)|last (?:one|query|result))\b",
+    re.IGNORECASE
+)
+
 class SQLOutputParser:
     """Custom output parser for SQL queries"""
     
@@ -77,6 +90,24 @@ class NeuronDBAI:
         self.database_schema = {}
         self.conversation_history = []
         
+        # Generated queries by schema fingerprint + normalized request, oldest first
+        loaded = safe_json_load(AI_CACHE_FILE) if Config.AI_CACHE_ENABLED else {}
+        # A hand-edited or foreign file may hold other JSON; start empty then
+        if not isinstance(loaded, dict):
+            loaded = {}
+        self._query_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict(loaded)
+        self._query_cache_lock = threading.Lock()
+        self._schema_fingerprint = None
+        
+        # Schema prompt text, and its server-side context cache when supported
+        self._schema_context = None
+        self._context_cache = None
+        self._cached_model = None
+        self._context_cache_stale = False
+        # Generations run on several workers; this keeps them from creating
+        # or deleting the server-side cache concurrently
+        self._context_cache_lock = threading.Lock()
+        
         # Create the prompt template
         self.sql_prompt_template = """
 You are an expert PostgreSQL database assistant. Your task is to generate accurate SQL queries based on user requests.
@@ -118,10 +149,67 @@ SELECT * FROM users WHERE active = true;
     def set_database_schema(self, schema: Dict[str, Any]):
         """Set the database schema context for AI assistant"""
         self.database_schema = schema
+        self._schema_context = None
+        self._schema_fingerprint = None
+        self._context_cache_stale = True
         logger.info("Database schema updated for AI assistant")
     
+    def _ensure_context_cache(self):
+        """Cache the schema prompt with Gemini when the SDK and model support it
+        
+        Returns the cached-context model to generate with, or None to send the
+        schema inline.
+        """
+        with self._context_cache_lock:
+            if self._context_cache_stale:
+                self._context_cache_stale = False
+                self._release_context_cache()
+                self._create_context_cache()
+            return self._cached_model
+    
+    def _create_context_cache(self):
+        """Create the server-side schema cache; the caller holds the lock"""
+        # Context caching needs a newer google-generativeai; older ones send the schema inline
+        caching = getattr(genai, "caching", None)
+        if caching is None or not self.database_schema:
+            return
+        
+        try:
+            self._context_cache = caching.CachedContent.create(
+                model=Config.AI_MODEL,
+                display_name="neurondb-schema",
+                contents=[f"DATABASE SCHEMA:\n{self._format_schema_context()}"],
+                ttl=timedelta(hours=1)
+            )
+            self._cached_model = genai.GenerativeModel.from_cached_content(self._context_cache)
+            logger.info("Schema context cached with Gemini")
+        except Exception as e:
+            # Unsupported model or a schema below the minimum cacheable size
+            self._context_cache = None
+            logger.info(f"Schema context not cached, sending it inline: {e}")
+    
+    def release_context_cache(self):
+        """Delete the server-side schema cache, if one was created"""
+        with self._context_cache_lock:
+            self._release_context_cache()
+    
+    def _release_context_cache(self):
+        """Delete the server-side schema cache; the caller holds the lock"""
+        context_cache, self._context_cache, self._cached_model = self._context_cache, None, None
+        if context_cache is not None:
+            try:
+                context_cache.delete()
+            except Exception as e:
+                logger.warning(f"Failed to delete schema context cache: {e}")
+    
     def _format_schema_context(self) -> str:
-        """Format database schema for prompt context"""
+        """Format database schema for prompt context, once per schema"""
+        if self._schema_context is None:
+            self._schema_context = self._build_schema_context()
+        return self._schema_context
+    
+    def _build_schema_context(self) -> str:
+        """Build the schema description used in prompts"""
         if not self.database_schema:
             return "No database schema available."
         
@@ -170,11 +258,75 @@ SELECT * FROM users WHERE active = true;
         
         return "\n".join(history_parts)
     
+    def _cache_key(self, user_query: str) -> str:
+        """Cache key for a request against the current schema"""
+        if self._schema_fingerprint is None:
+            self._schema_fingerprint = hashlib.sha256(self._format_schema_context().encode()).hexdigest()
+        
+        # Normalize so trivially different phrasings share an entry
+        normalized = " ".join(user_query.lower().split()).rstrip(" .?!;")
+        return hashlib.sha256(f"{self._schema_fingerprint}\n{normalized}".encode()).hexdigest()
+    
+    def _is_follow_up(self, user_query: str) -> bool:
+        """Whether a request builds on the earlier conversation"""
+        return bool(self.conversation_history) and _FOLLOW_UP_PATTERN.search(user_query) is not None
+    
+    def _store_cached_query(self, cache_key: str, sql_query: str, explanation: Optional[str]):
+        """Remember a generated query and persist the cache"""
+        with self._query_cache_lock:
+            self._query_cache[cache_key] = {'query': sql_query, 'explanation': explanation}
+            if len(self._query_cache) > Config.AI_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+            snapshot = dict(self._query_cache)
+        safe_json_save(snapshot, AI_CACHE_FILE)
+    
+    def _record_interaction(self, user_query: str, sql_query: str):
+        """Add a successful generation to the conversation history"""
+        interaction = {
+            'user_query': user_query,
+            'generated_query': sql_query,
+            'timestamp': None,  # You can add timestamp if needed
+            'error': None
+        }
+        self.conversation_history.append(interaction)
+        
+        # Keep only last 20 interactions
+        if len(self.conversation_history) > 20:
+            self.conversation_history = self.conversation_history[-20:]
+    
     def generate_sql_query(self, user_query: str) -> Dict[str, Any]:
         """Generate SQL query from natural language input"""
+        # Standalone requests are cached by schema and request alone, so
+        # repeating one in the same session hits; follow-ups always generate
+        use_cache = Config.AI_CACHE_ENABLED and not self._is_follow_up(user_query)
+        cache_key = self._cache_key(user_query) if use_cache else None
+        cached = None
+        if use_cache:
+            with self._query_cache_lock:
+                cached = self._query_cache.get(cache_key)
+                if cached is not None:
+                    self._query_cache.move_to_end(cache_key)
+        
+        # Entries written by older versions were bare strings; regenerate those
+        if isinstance(cached, dict):
+            self._record_interaction(user_query, cached['query'])
+            logger.info(f"Reused cached SQL query for: {user_query[:50]}...")
+            return {
+                'success': True,
+                'query': cached['query'],
+                'explanation': cached.get('explanation'),
+                'user_input': user_query,
+                'cached': True
+            }
+        
         try:
-            # Format context
-            schema_context = self._format_schema_context()
+            # Format context; a cached schema only needs a pointer in the prompt
+            cached_model = self._ensure_context_cache()
+            model = cached_model or self.model
+            if cached_model is not None:
+                schema_context = "(provided in the cached context above)"
+            else:
+                schema_context = self._format_schema_context()
             conversation_history = self._format_conversation_history()
             
             # Create the full prompt
@@ -185,32 +337,28 @@ SELECT * FROM users WHERE active = true;
             )
             
             # Generate response using Gemini
-            response = self.model.generate_content(prompt)
+            response = model.generate_content(prompt)
             generated_text = response.text
             
             # Parse the SQL query
             parser = SQLOutputParser()
             sql_query = parser.parse(generated_text)
             
+            explanation = generated_text if generated_text != sql_query else None
+            
             # Store in conversation history
-            interaction = {
-                'user_query': user_query,
-                'generated_query': sql_query,
-                'timestamp': None,  # You can add timestamp if needed
-                'error': None
-            }
-            self.conversation_history.append(interaction)
+            self._record_interaction(user_query, sql_query)
             
-            # Keep only last 20 interactions
-            if len(self.conversation_history) > 20:
-                self.conversation_history = self.conversation_history[-20:]
+            # Only cache replies that are actually SQL, not "cannot generate" notes
+            if use_cache and validate_sql_syntax(sql_query)['valid']:
+                self._store_cached_query(cache_key, sql_query, explanation)
             
             logger.info(f"Generated SQL query for: {user_query[:50]}...")
             
             return {
                 'success': True,
                 'query': sql_query,
-                'explanation': generated_text if generated_text != sql_query else None,
+                'explanation': explanation,
                 'user_input': user_query
             }
             
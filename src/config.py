@@ -35,6 +35,8 @@ class Config:
     GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
     AI_MODEL = "gemini-2.0-flash-exp"  # Latest Gemini 2.0 Flash model
     AI_MAX_HISTORY = 20
+    AI_CACHE_ENABLED = os.getenv("AI_CACHE_ENABLED", "true").lower() != "false"
+    AI_CACHE_SIZE = 512  # generated queries kept across schemas
     
     # UI Configuration
     THEME_MODE = "dark"  # "light", "dark", "system"
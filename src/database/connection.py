@@ -5,20 +5,40 @@ Handles PostgreSQL connections and schema introspection
 
 import psycopg2
 import psycopg2.extras
+from psycopg2.pool import ThreadedConnectionPool, PoolError
+from contextlib import contextmanager
 from typing import Dict, List, Optional, Tuple, Any
 import json
+import time
+import threading
 from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Pooled connections per database, used for schema loads and liveness probes.
+# Each of the 4 db-io workers, the 4 query-panel workers and the main thread
+# can hold one at a time; user queries run on their own session connection
+POOL_MIN_CONNECTIONS = 1
+POOL_MAX_CONNECTIONS = 9
+
+# Seconds a successful liveness probe is trusted before probing again
+PROBE_TTL = 2.0
+
+# Session settings applied to the query session and every pooled connection
+SESSION_OPTIONS = "-c lock_timeout=5s -c statement_timeout=60s"
+
 class DatabaseConnection:
     """Manages PostgreSQL database connections"""
     
     def __init__(self):
+        # User queries share one session connection, so SET, temp tables and
+        # open transactions carry over between runs; the lock serializes them
         self.connection = None
-        self.cursor = None
+        self._query_lock = threading.Lock()
+        self.pool = None
         self.connection_info = {}
+        self._conn_ok_until = 0.0
         
     def connect(self, host: str, port: int, database: str, username: str, password: str) -> bool:
         """Establish connection to PostgreSQL database"""
@@ -32,17 +52,25 @@ class DatabaseConnection:
             connection_string = f"host='{host}' port='{port}' dbname='{database}' user='{username}' password='{password}'"
             logger.info(f"[CONNECTION] Connecting to PostgreSQL...")
             
-            self.connection = psycopg2.connect(connection_string, connect_timeout=10)
-            logger.info(f"[CONNECTION] Connection established successfully")
-            
-            # Set lock timeout to avoid hanging on locked tables
-            with self.connection.cursor() as cur:
-                cur.execute("SET application_name = 'NeuronDB';")
-                cur.execute("SET lock_timeout = '5s';")  # Fail fast if table is locked
-                cur.execute("SET statement_timeout = '60s';")  # Overall query timeout
+            # Replace any previous connections rather than leaking them
+            self._close_connections()
             
-            self.cursor = self.connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-            logger.info(f"[CONNECTION] Cursor created")
+            # Lock/statement timeouts keep queries from hanging on locked tables
+            self.connection = psycopg2.connect(
+                connection_string,
+                connect_timeout=10,
+                application_name='NeuronDB',
+                options=SESSION_OPTIONS
+            )
+            self.pool = ThreadedConnectionPool(
+                POOL_MIN_CONNECTIONS,
+                POOL_MAX_CONNECTIONS,
+                connection_string,
+                connect_timeout=10,
+                application_name='NeuronDB',
+                options=SESSION_OPTIONS
+            )
+            logger.info(f"[CONNECTION] Connection and pool established successfully")
             
             self.connection_info = {
                 'host': host,
@@ -64,26 +92,11 @@ class DatabaseConnection:
         try:
             logger.info("[CONNECTION] Closing database connection...")
             
-            # Close cursor
-            if self.cursor:
-                try:
-                    self.cursor.close()
-                    logger.info("[CONNECTION] Cursor closed")
-                except Exception as e:
-                    logger.warning(f"[CONNECTION] Error closing cursor: {e}")
-            
-            # Close connection
-            if self.connection:
-                try:
-                    self.connection.close()
-                    logger.info("[CONNECTION] Connection closed")
-                except Exception as e:
-                    logger.warning(f"[CONNECTION] Error closing connection: {e}")
+            self._close_connections()
             
             # Clear connection info
-            self.connection = None
-            self.cursor = None
             self.connection_info = {}
+            self._conn_ok_until = 0.0
             
             logger.info("[CONNECTION] ✅ Database connection closed successfully")
             
@@ -91,44 +104,107 @@ class DatabaseConnection:
             logger.error(f"[CONNECTION] ❌ Error during disconnect: {type(e).__name__}: {e}")
             # Force clear even if there's an error
             self.connection = None
-            self.cursor = None
+            self.pool = None
             self.connection_info = {}
     
+    def _close_connections(self):
+        """Close the query session and the pool"""
+        connection, self.connection = self.connection, None
+        if connection is not None:
+            try:
+                # Abort a running query so its worker releases the session
+                connection.cancel()
+                with self._query_lock:
+                    connection.close()
+                logger.info("[CONNECTION] Connection closed")
+            except Exception as e:
+                logger.warning(f"[CONNECTION] Error closing connection: {e}")
+        
+        pool, self.pool = self.pool, None
+        if pool is not None:
+            try:
+                pool.closeall()
+                logger.info("[CONNECTION] Connection pool closed")
+            except Exception as e:
+                logger.warning(f"[CONNECTION] Error closing connection pool: {e}")
+    
     def is_connected(self) -> bool:
         """Check if database connection is active"""
+        connection, pool = self.connection, self.pool
+        if connection is None or connection.closed or pool is None or pool.closed:
+            return False
+        
+        # Recent successful probes or queries vouch for the server
+        now = time.monotonic()
+        if now < self._conn_ok_until:
+            return True
+        
+        ok = self._probe()
+        self._conn_ok_until = now + PROBE_TTL if ok else 0.0
+        return ok
+    
+    def _probe(self) -> bool:
+        """Test the server with a simple query"""
         try:
-            if self.connection is None:
-                return False
-            # Test connection with a simple query
-            with self.connection.cursor() as test_cursor:
-                test_cursor.execute("SELECT 1")
+            with self._cursor() as (conn, cursor):
+                cursor.execute("SELECT 1")
             return True
-        except:
+        except Exception:
             return False
     
+    @staticmethod
+    def _release(pool, conn):
+        """Return a borrowed connection, closing it if the pool was closed meanwhile"""
+        try:
+            # The pool rolls back anything left open before reuse
+            pool.putconn(conn)
+        except PoolError:
+            conn.close()
+    
+    @contextmanager
+    def _cursor(self):
+        """Borrow a pooled connection and a dict cursor on it"""
+        pool = self.pool
+        conn = pool.getconn()
+        try:
+            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+                yield conn, cursor
+        finally:
+            self._release(pool, conn)
+    
     def execute_query(self, query: str, params: Optional[Tuple] = None) -> Tuple[List[Dict], List[str]]:
-        """Execute SQL query and return results"""
+        """Execute SQL query on the session connection and return results"""
         if not self.is_connected():
             raise Exception("Not connected to database")
         
-        try:
-            self.cursor.execute(query, params)
+        with self._query_lock:
+            conn = self.connection
+            if conn is None or conn.closed:
+                raise Exception("Not connected to database")
             
-            # For SELECT queries, fetch results
-            if query.strip().upper().startswith('SELECT'):
-                results = self.cursor.fetchall()
-                columns = [desc[0] for desc in self.cursor.description] if self.cursor.description else []
-                return results, columns
-            else:
-                # For non-SELECT queries, commit and return affected rows
-                self.connection.commit()
-                affected_rows = self.cursor.rowcount
-                return [{'affected_rows': affected_rows}], ['affected_rows']
-                
-        except Exception as e:
-            self.connection.rollback()
-            logger.error(f"Query execution failed: {e}")
-            raise e
+            try:
+                with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+                    cursor.execute(query, params)
+                    self._conn_ok_until = time.monotonic() + PROBE_TTL
+                    
+                    # For SELECT queries, fetch results
+                    if query.strip().upper().startswith('SELECT'):
+                        results = cursor.fetchall()
+                        columns = [desc[0] for desc in cursor.description] if cursor.description else []
+                        return results, columns
+                    else:
+                        # For non-SELECT queries, commit and return affected rows
+                        conn.commit()
+                        affected_rows = cursor.rowcount
+                        return [{'affected_rows': affected_rows}], ['affected_rows']
+                    
+            except Exception as e:
+                # The failure may be the connection itself; probe again next time
+                self._conn_ok_until = 0.0
+                if not conn.closed:
+                    conn.rollback()
+                logger.error(f"Query execution failed: {e}")
+                raise e
     
     def get_database_schema(self) -> Dict[str, Any]:
         """Get complete database schema information"""
@@ -144,10 +220,13 @@ class DatabaseConnection:
             'schemas': []
         }
         
+        pool = self.pool
+        conn = pool.getconn()
+        cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
         try:
             # Get all schemas (excluding system and TimescaleDB internal schemas)
             logger.info("[SCHEMA] Fetching schemas...")
-            self.cursor.execute("""
+            cursor.execute("""
                 SELECT nspname as schema_name
                 FROM pg_catalog.pg_namespace
                 WHERE nspname NOT IN ('information_schema', 'pg_catalog', 'pg_toast')
@@ -156,13 +235,13 @@ class DatabaseConnection:
                 AND nspname NOT LIKE 'timescaledb_%'
                 ORDER BY nspname
             """)
-            schema_info['schemas'] = [row['schema_name'] for row in self.cursor.fetchall()]
+            schema_info['schemas'] = [row['schema_name'] for row in cursor.fetchall()]
             logger.info(f"[SCHEMA] Found {len(schema_info['schemas'])} user schemas: {schema_info['schemas']}")
             
             # Get all tables with their columns (excluding system and TimescaleDB schemas)
             # Using pg_catalog for better performance with TimescaleDB
             logger.info("[SCHEMA] Fetching tables and columns...")
-            self.cursor.execute("""
+            cursor.execute("""
                 SELECT 
                     n.nspname as table_schema,
                     c.relname as table_name,
@@ -186,7 +265,7 @@ class DatabaseConnection:
             """)
             
             logger.info("[SCHEMA] Query executed, fetching results...")
-            tables_data = self.cursor.fetchall()
+            tables_data = cursor.fetchall()
             logger.info(f"[SCHEMA] Retrieved {len(tables_data)} column definitions")
             
             for row in tables_data:
@@ -215,7 +294,7 @@ class DatabaseConnection:
             
             # Get primary keys (using pg_catalog for better performance)
             logger.info("[SCHEMA] Fetching primary keys...")
-            self.cursor.execute("""
+            cursor.execute("""
                 SELECT 
                     n.nspname as table_schema,
                     c.relname as table_name,
@@ -231,7 +310,7 @@ class DatabaseConnection:
                     AND n.nspname NOT LIKE 'timescaledb_%'
             """)
             
-            pk_rows = self.cursor.fetchall()
+            pk_rows = cursor.fetchall()
             logger.info(f"[SCHEMA] Found {len(pk_rows)} primary key constraints")
             
             for row in pk_rows:
@@ -243,7 +322,7 @@ class DatabaseConnection:
             
             # Get foreign keys (using pg_catalog for better performance)
             logger.info("[SCHEMA] Fetching foreign keys...")
-            self.cursor.execute("""
+            cursor.execute("""
                 SELECT 
                     n1.nspname as table_schema,
                     c1.relname as table_name,
@@ -265,7 +344,7 @@ class DatabaseConnection:
                     AND n1.nspname NOT LIKE 'timescaledb_%'
             """)
             
-            fk_rows = self.cursor.fetchall()
+            fk_rows = cursor.fetchall()
             logger.info(f"[SCHEMA] Found {len(fk_rows)} foreign key constraints")
             
             for row in fk_rows:
@@ -280,7 +359,7 @@ class DatabaseConnection:
             
             # Get views (using pg_catalog for better performance)
             logger.info("[SCHEMA] Fetching views...")
-            self.cursor.execute("""
+            cursor.execute("""
                 SELECT 
                     n.nspname as table_schema,
                     c.relname as table_name,
@@ -295,7 +374,7 @@ class DatabaseConnection:
                 ORDER BY n.nspname, c.relname
             """)
             
-            view_rows = self.cursor.fetchall()
+            view_rows = cursor.fetchall()
             logger.info(f"[SCHEMA] Found {len(view_rows)} views")
             
             for row in view_rows:
@@ -327,6 +406,9 @@ class DatabaseConnection:
             else:
                 logger.error(f"[SCHEMA] ❌ Failed to retrieve database schema: {error_type}: {e}")
                 raise e
+        finally:
+            cursor.close()
+            self._release(pool, conn)
 
 class ConnectionManager:
     """Manages saved database connections"""
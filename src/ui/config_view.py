@@ -9,10 +9,7 @@ import customtkinter as ctk
 from typing import Optional, Dict, Any
 import os
 from pathlib import Path
-import sys
 
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
 from utils.theme_manager import theme_manager
 from utils.config_manager import config_manager
 
@@ -6,11 +6,7 @@ import tkinter as tk
 from tkinter import messagebox
 import customtkinter as ctk
 from typing import Dict, Any, Optional
-import sys
-from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
 from utils.theme_manager import theme_manager
 
 class ConnectionDialog(ctk.CTkToplevel):
@@ -7,9 +7,18 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import customtkinter as ctk
 from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
 import re
 
 
+# Zoom steps are 0.1 apart between DiagramCanvas.min_zoom and max_zoom, so the
+# label for every reachable level can be built once instead of per wheel tick.
+_ZOOM_LABELS = {round(step / 10, 4): f"{step * 10}%" for step in range(3, 31)}
+
+# Single worker so DBML parsing never blocks the Tk main loop
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dbml-parse")
+
+
 class Table:
     """Represents a database table"""
     def __init__(self, name: str):
@@ -578,6 +587,7 @@ class DBDiagramView(ctk.CTkFrame):
         
         self.current_tables = {}
         self.current_relationships = []
+        self._last_zoom_text = "100%"
         
         # Resizable panel settings
         self.resizing = False
@@ -671,7 +681,7 @@ class DBDiagramView(ctk.CTkFrame):
         button_frame = ctk.CTkFrame(self.left_panel, fg_color="transparent")
         button_frame.pack(pady=(0, 10))
         
-        generate_btn = ctk.CTkButton(
+        self.generate_btn = ctk.CTkButton(
             button_frame,
             text="Generate Diagram",
             command=self.generate_diagram,
@@ -682,7 +692,7 @@ class DBDiagramView(ctk.CTkFrame):
             hover_color="#87795A",
             corner_radius=6
         )
-        generate_btn.pack(side="left", padx=5)
+        self.generate_btn.pack(side="left", padx=5)
         
         clear_btn = ctk.CTkButton(
             button_frame,
@@ -837,13 +847,21 @@ Ref: comments.user_id > users.id
         """Generate diagram from DBML"""
         dbml_code = self.dbml_text.get("1.0", tk.END)
         
-        if not dbml_code.strip():
+        if not dbml_code or dbml_code.isspace():
             messagebox.showwarning("Empty Schema", "Please enter DBML schema code")
             return
         
+        # Parse in the background; disable the button so clicks don't pile up
+        self.generate_btn.configure(state="disabled")
+        future = _EXECUTOR.submit(DBMLParser.parse, dbml_code)
+        future.add_done_callback(lambda f: self.after(0, self._on_parsed, f))
+    
+    def _on_parsed(self, future):
+        """Called in main thread once the DBML has been parsed"""
+        self.generate_btn.configure(state="normal")
+        
         try:
-            # Parse DBML
-            tables, relationships = DBMLParser.parse(dbml_code)
+            tables, relationships = future.result()
             
             if not tables:
                 messagebox.showwarning("No Tables", "No tables found in DBML schema")
@@ -869,8 +887,11 @@ Ref: comments.user_id > users.id
     
     def update_zoom_label(self, zoom_level):
         """Update the zoom percentage label"""
-        percentage = int(zoom_level * 100)
-        self.zoom_label.configure(text=f"{percentage}%")
+        text = _ZOOM_LABELS.get(round(zoom_level, 4)) or f"{int(zoom_level * 100)}%"
+        if text == self._last_zoom_text:
+            return
+        self._last_zoom_text = text
+        self.zoom_label.configure(text=text)
     
     def start_resize(self, event):
         """Start resizing the left panel"""
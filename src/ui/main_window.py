@@ -6,20 +6,20 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import customtkinter as ctk
 from typing import Dict, Any, Optional
-import sys
+from functools import partial, lru_cache
+from operator import itemgetter
 import os
-from pathlib import Path
-import pandas as pd
-from datetime import datetime
-from PIL import Image, ImageTk
+import re
+import csv
+import math
+from datetime import datetime, date, time, timedelta
+from decimal import Decimal
 import threading
-
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
+from time import monotonic
+from concurrent.futures import ThreadPoolExecutor
 
 from database.connection import DatabaseConnection, ConnectionManager
-from ai.assistant import NeuronDBAI
-from utils.helpers import setup_logging
+from utils.helpers import setup_logging, get_app_config_dir, safe_json_load, safe_json_save
 from utils.theme_manager import theme_manager
 from utils.config_manager import config_manager, apply_startup_theme
 from ui.connection_dialog import ConnectionDialog
@@ -34,87 +34,310 @@ from config import Config
 ctk.set_appearance_mode("light")  # Modes: "System" (standard), "Dark", "Light"
 ctk.set_default_color_theme("blue")  # Themes: "blue" (standard), "green", "dark-blue"
 
+# Resolved CTk overrides from the last run, keyed by theme file and mtime
+THEME_CACHE_FILE = get_app_config_dir() / "theme_cache.json"
+
+# Main window size and position from the previous session
+WINDOW_GEOMETRY_FILE = get_app_config_dir() / "window_geometry.json"
+DEFAULT_GEOMETRY = "1600x1100"
+
+def _theme_cache_key() -> str:
+    """Identify the current theme file version for the on-disk cache"""
+    theme_name = theme_manager.current_theme_name
+    theme_info = theme_manager.available_themes.get(theme_name)
+    if not theme_info:
+        return ""
+    return f"{theme_name}:{theme_info['file'].stat().st_mtime_ns}"
+
+def _resolve_ctk_overrides() -> Dict[str, Dict[str, Any]]:
+    """Build the CustomTkinter default overrides for the current theme"""
+    get_color = theme_manager.get_color
+    
+    # Resolve each color once; light/dark lanes share the same value
+    main_bg = [get_color("background.main")] * 2
+    primary_bg = [get_color("buttons.primary_bg")] * 2
+    primary_hover = [get_color("buttons.primary_hover")] * 2
+    text_primary = [get_color("text.primary")] * 2
+    
+    return {
+        # Background colors
+        "CTkFrame": {"fg_color": main_bg},
+        "CTk": {"fg_color": main_bg},
+        # Button colors
+        "CTkButton": {
+            "fg_color": primary_bg,
+            "hover_color": primary_hover,
+            "text_color": [get_color("buttons.primary_text")] * 2,
+        },
+        # Scrollable frame colors
+        "CTkScrollableFrame": {"fg_color": main_bg},
+        # Entry/input colors
+        "CTkEntry": {
+            "fg_color": [get_color("editor.background")] * 2,
+            "border_color": [get_color("accent.main")] * 2,
+            "text_color": text_primary,
+        },
+        # Label colors
+        "CTkLabel": {"text_color": text_primary},
+        # Optionmenu colors
+        "CTkOptionMenu": {
+            "fg_color": [get_color("buttons.secondary_bg")] * 2,
+            "button_color": primary_bg,
+            "button_hover_color": primary_hover,
+        },
+    }
+
+# Cache key of the theme whose overrides are currently in ctk.ThemeManager
+_applied_ctk_key = None
+
 # Configure CTk default colors using theme manager
-def apply_theme_to_ctk():
-    """Apply current theme colors to CustomTkinter defaults"""
+def apply_theme_to_ctk(use_cache: bool = False):
+    """Apply current theme colors to CustomTkinter defaults
+    
+    With use_cache, overrides saved by a previous launch are reused when
+    the theme file has not changed since they were written. Re-applying
+    the theme version that is already in place is a no-op.
+    """
+    global _applied_ctk_key
     try:
-        # Apply background colors
-        ctk.ThemeManager.theme["CTkFrame"]["fg_color"] = [
-            theme_manager.get_color("background.main"), 
-            theme_manager.get_color("background.main")
-        ]
-        ctk.ThemeManager.theme["CTk"]["fg_color"] = [
-            theme_manager.get_color("background.main"), 
-            theme_manager.get_color("background.main")
-        ]
-        
-        # Apply button colors
-        ctk.ThemeManager.theme["CTkButton"]["fg_color"] = [
-            theme_manager.get_color("buttons.primary_bg"), 
-            theme_manager.get_color("buttons.primary_bg")
-        ]
-        ctk.ThemeManager.theme["CTkButton"]["hover_color"] = [
-            theme_manager.get_color("buttons.primary_hover"), 
-            theme_manager.get_color("buttons.primary_hover")
-        ]
-        ctk.ThemeManager.theme["CTkButton"]["text_color"] = [
-            theme_manager.get_color("buttons.primary_text"), 
-            theme_manager.get_color("buttons.primary_text")
-        ]
-        
-        # Apply scrollable frame colors
-        ctk.ThemeManager.theme["CTkScrollableFrame"]["fg_color"] = [
-            theme_manager.get_color("background.main"), 
-            theme_manager.get_color("background.main")
-        ]
-        
-        # Apply entry/input colors
-        ctk.ThemeManager.theme["CTkEntry"]["fg_color"] = [
-            theme_manager.get_color("editor.background"), 
-            theme_manager.get_color("editor.background")
-        ]
-        ctk.ThemeManager.theme["CTkEntry"]["border_color"] = [
-            theme_manager.get_color("accent.main"), 
-            theme_manager.get_color("accent.main")
-        ]
-        ctk.ThemeManager.theme["CTkEntry"]["text_color"] = [
-            theme_manager.get_color("text.primary"), 
-            theme_manager.get_color("text.primary")
-        ]
-        
-        # Apply label colors
-        ctk.ThemeManager.theme["CTkLabel"]["text_color"] = [
-            theme_manager.get_color("text.primary"), 
-            theme_manager.get_color("text.primary")
-        ]
-        
-        # Apply optionmenu colors
-        ctk.ThemeManager.theme["CTkOptionMenu"]["fg_color"] = [
-            theme_manager.get_color("buttons.secondary_bg"), 
-            theme_manager.get_color("buttons.secondary_bg")
-        ]
-        ctk.ThemeManager.theme["CTkOptionMenu"]["button_color"] = [
-            theme_manager.get_color("buttons.primary_bg"), 
-            theme_manager.get_color("buttons.primary_bg")
-        ]
-        ctk.ThemeManager.theme["CTkOptionMenu"]["button_hover_color"] = [
-            theme_manager.get_color("buttons.primary_hover"), 
-            theme_manager.get_color("buttons.primary_hover")
-        ]
+        cache_key = _theme_cache_key()
+        if cache_key and cache_key == _applied_ctk_key:
+            return
+        overrides = None
+        
+        if use_cache and cache_key:
+            cached = safe_json_load(THEME_CACHE_FILE, {})
+            if cached.get("key") == cache_key:
+                overrides = cached.get("overrides")
+        
+        if overrides is None:
+            overrides = _resolve_ctk_overrides()
+            if cache_key:
+                safe_json_save({"key": cache_key, "overrides": overrides}, THEME_CACHE_FILE)
+        
+        theme = ctk.ThemeManager.theme
+        for widget, values in overrides.items():
+            theme[widget].update(values)
+        _applied_ctk_key = cache_key
         
         print("Applied theme to CTk components")
     except Exception as e:
         print(f"Error applying theme to CTk: {e}")
 
-# Apply theme
-apply_theme_to_ctk()
+# Tcl lambda that writes a flat list of (id, text, values, tag) groups into a
+# Treeview; existing ids are updated in place, new ones are inserted at the
+# end or in order starting from a numeric index
+_TCL_BULK_INSERT = (
+    "{tree rows {index end}} {foreach {id text values tag} $rows "
+    "{if {[$tree exists $id]} {$tree item $id -text $text -values $values -tags $tag} "
+    "else {$tree insert {} $index -id $id -text $text -values $values -tags $tag; "
+    "if {$index ne {end}} {incr index}}}}"
+)
+
+# Newlines, tabs and carriage returns are shown as spaces in result cells
+_WS_TABLE = str.maketrans("\n\t\r", "   ")
+
+# Colors read by the results display and cell dialogs, snapshotted per theme
+_THEME_SNAPSHOT_KEYS = (
+    "background.main", "background.secondary", "editor.background", "text.primary",
+    "buttons.primary_bg", "buttons.primary_text", "button.background",
+    "button.hoverBackground", "sideBarSectionHeader.background", "table.background",
+)
+
+# Result cells longer than this are truncated for display
+MAX_CELL_DISPLAY_LEN = 200
+
+# Buffer size for CSV exports, so large result sets go out in few write calls
+CSV_WRITE_BUFFER = 1 << 20
+
+# CSV exports report progress after each block of this many rows
+EXPORT_PROGRESS_ROWS = 5000
+
+# Approximate text area of the full-value dialog, in characters and lines
+CELL_DIALOG_CHARS = 64
+CELL_DIALOG_LINES = 14
+
+# Seconds to wait for the database disconnect and AI cache release when closing
+SHUTDOWN_TIMEOUT = 2.0
+
+# Status bar updates arriving within this many ms are coalesced
+STATUS_DEBOUNCE_MS = 50
+
+# Rows inserted into the results table per idle cycle
+RESULTS_INSERT_CHUNK = 500
+
+# Default for optional arguments where None is a meaningful value
+_UNSET = object()
+
+# Result sets with at least this many rows only keep a window of rows in the
+# table, sized to a few screens of the visible viewport
+RESULTS_VIRTUAL_THRESHOLD = 2000
+RESULTS_WINDOW_ROWS = 1000
+RESULTS_WINDOW_SCREENS = 8
+RESULTS_MIN_WINDOW_ROWS = 200
+RESULTS_ROW_HEIGHT = 25
+
+# Result sets with at least this many rows are stored column-wise as well
+COLUMNAR_RESULTS_THRESHOLD = 500
+
+# Result sets up to this size are formatted in plain Python, skipping pandas
+SMALL_RESULTS_ROWS = 50
+
+def _row_picker(columns):
+    """Function returning a result row's values in column order as a tuple"""
+    getter = itemgetter(*columns)
+    single = len(columns) == 1
+    
+    def pick(row):
+        try:
+            values = getter(row)
+        except KeyError:
+            # Sparse rows fall back to None for missing columns
+            return tuple(row.get(col) for col in columns)
+        return (values,) if single else values
+    
+    return pick
+
+@lru_cache(maxsize=None)
+def _font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """Shared CTkFont for a size and weight, created on first use"""
+    return ctk.CTkFont(size=size, weight=weight)
+
+def _content_width(length: int) -> int:
+    """Estimated pixel width for a result cell of `length` characters"""
+    if length <= 10:
+        return length * 12
+    return length * 10 if length <= 50 else 300
+
+def _preload_data_modules():
+    """Import the result-processing libraries ahead of first use"""
+    import pandas  # noqa: F401
+
+def _describe_table_sql(match) -> str:
+    """Column listing for a `describe [schema.]table` request"""
+    schema, table = match.group(1), match.group(2)
+    schema_filter = f"table_schema = '{schema}'" if schema else "table_schema NOT IN ('pg_catalog', 'information_schema')"
+    return (
+        "SELECT table_schema, column_name, data_type, is_nullable\n"
+        "FROM information_schema.columns\n"
+        f"WHERE table_name = '{table}' AND {schema_filter}\n"
+        "ORDER BY table_schema, ordinal_position;"
+    )
+
+# Requests answered with canned SQL instead of a round-trip to the AI model
+_TRIVIAL_AI_PATTERNS = [
+    (re.compile(r"^\s*(?:list|show)\s+(?:all\s+)?tables\s*[.?!]?\s*$", re.I),
+     lambda match: (
+         "SELECT table_schema, table_name\n"
+         "FROM information_schema.tables\n"
+         "WHERE table_schema NOT IN ('pg_catalog', 'information_schema')\n"
+         "ORDER BY table_schema, table_name;"
+     )),
+    (re.compile(r"^\s*describe\s+(?:table\s+)?(?:(\w+)\.)?(\w+)\s*[.?!]?\s*$", re.I),
+     _describe_table_sql),
+    # "count rows in <table>" or "count <table>"; a bare "count rows" or
+    # "count all" is too vague and goes to the model
+    (re.compile(r"^\s*count\s+(?:(?:all\s+)?rows\s+(?:in|of|from)\s+|(?!(?:all|rows|records|entries|everything)\b))"
+                r"(\w+(?:\.\w+)?)\s*[.?!]?\s*$", re.I),
+     lambda match: f"SELECT COUNT(*) FROM {match.group(1)};"),
+]
+
+# Help > About dialog text
+_ABOUT_TEXT = """NeuronDB - AI-Powered PostgreSQL Client
+
+Version: 1.0.0
+
+A modern desktop application that brings AI assistance to PostgreSQL database management.
+
+Features:
+• AI-powered query generation with Google Gemini
+• Visual schema browser
+• Advanced query editor with saved queries
+• Built-in PSQL terminal
+• Connection management
+• Excel export support
+
+Built with Python, CustomTkinter, and LangChain.
+"""
+
+# Values xlsxwriter writes natively; anything else is exported as its text
+_EXCEL_NATIVE_TYPES = (str, int, float, Decimal, datetime, date, time, timedelta)
+
+def _excel_value(value):
+    """Cell value in a form xlsxwriter can write; None, NaN and NaT become blank"""
+    if value is None:
+        return None
+    if isinstance(value, (float, Decimal, datetime)):
+        # NaN and NaT are the only values not equal to themselves
+        if value != value:
+            return None
+        # xlsxwriter rejects infinities, so they go out as text
+        if not isinstance(value, datetime) and not math.isfinite(value):
+            return str(value)
+    if isinstance(value, _EXCEL_NATIVE_TYPES):
+        return value
+    return str(value)
+
+def _excel_width(value):
+    """Text width of a converted Excel cell value"""
+    return 0 if value is None else len(str(value))
 
 class NeuronDBApp(ctk.CTk):
     """Main application window for NeuronDB"""
     
+    # Menu bar layout: (menu label, [(item label, handler method name)]);
+    # a None label adds a separator
+    MENU_SPEC = [
+        ("File", [
+            ("New Connection...", "show_connection_dialog"),
+            (None, None),
+            ("Exit", "on_closing"),
+        ]),
+        ("Connection", [
+            ("Connect...", "show_connection_dialog"),
+            ("Disconnect", "disconnect_database"),
+            (None, None),
+            ("Refresh Schema", "refresh_schema"),
+        ]),
+        ("Query", [
+            ("Execute Query", "execute_current_query"),
+            ("Clear Query", "clear_query"),
+            (None, None),
+            ("Format Query", "format_current_query"),
+        ]),
+        ("AI", [
+            ("Generate Query...", "show_ai_dialog"),
+            ("Explain Query", "explain_current_query"),
+            (None, None),
+            ("Clear Chat History", "clear_ai_history"),
+        ]),
+    ]
+    
     def __init__(self):
         super().__init__()
         
+        # Keep the window unmapped while it is built so widgets don't paint one by one
+        self.withdraw()
+        
+        # Widgets are not created until after the first apply_theme()
+        self._ui_built = False
+        
+        # Results context menu and its colors, built once and refreshed by apply_theme()
+        self._menu_colors = None
+        self._results_menu = None
+        self._full_cell_dialog = None
+        self._results_insert_job = None
+        self._pending_status = None
+        self._status_job = None
+        
+        # Pending debounced apply_theme() and the theme each child panel last applied
+        self._pending_theme_apply = None
+        self._child_themes = {}
+        
+        # Shared ttk style object and the last options configure_results_style() applied
+        self._style = ttk.Style(self)
+        self._last_style = {}
+        
         # Set up logging
         self.logger = setup_logging()
         
@@ -123,11 +346,15 @@ class NeuronDBApp(ctk.CTk):
 
         self.connection_manager = ConnectionManager()
         self.ai_assistant = None
+        self._ai_loading = False
+        
+        # Shared workers for connection and schema I/O
+        self._db_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="db-io")
         self.current_schema = {}
         
         # Configure main window
         self.title("NeuronDB")
-        self.geometry("1600x1100")
+        self.geometry(self._restored_geometry())
         self.minsize(1400, 950)
         
         # Initialize theme system with user's preferred theme
@@ -136,7 +363,7 @@ class NeuronDBApp(ctk.CTk):
         theme_manager.initialize_with_fallback(preferred_theme)
         print(f"Current theme: {theme_manager.get_theme_name()}")
         
-        # Apply theme before creating UI
+        # Apply theme before creating UI (the only CTk theme pass at startup)
         self.apply_theme()
         
         # Configure window for better text display
@@ -145,11 +372,7 @@ class NeuronDBApp(ctk.CTk):
         # Set window icon (desktop icon)
         try:
             if Config.DESKTOP_ICON.exists():
-                icon_image = Image.open(Config.DESKTOP_ICON)
-                icon_photo = ImageTk.PhotoImage(icon_image)
-                self.iconphoto(True, icon_photo)
-                # Keep reference to prevent garbage collection
-                self._icon_photo = icon_photo
+                self.iconphoto(True, self._load_icon_photo(Config.DESKTOP_ICON))
         except Exception as e:
             self.logger.warning(f"Could not load desktop icon: {e}")
         
@@ -162,62 +385,131 @@ class NeuronDBApp(ctk.CTk):
         self.create_menu_bar()
         self.create_main_interface()
         self.create_status_bar()
+        self._ui_built = True
+        self.after_idle(self.deiconify)
         
-        # Initialize AI assistant
-        self.init_ai_assistant()
+        # Initialize AI assistant and preload pandas once the window has painted
+        self.after_idle(self.init_ai_assistant)
+        self.after_idle(self._db_executor.submit, _preload_data_modules)
         
         # Bind close event
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
         
         self.logger.info("NeuronDB application initialized")
     
+    def _load_icon_photo(self, icon_path):
+        """Load the window icon, decoding with Tk's native PNG support when possible"""
+        try:
+            icon_photo = tk.PhotoImage(master=self, file=str(icon_path))
+        except tk.TclError:
+            # Formats Tk can't read natively still go through PIL
+            from PIL import Image, ImageTk
+            icon_photo = ImageTk.PhotoImage(Image.open(icon_path), master=self)
+        
+        # Keep reference to prevent garbage collection
+        self._icon_photo = icon_photo
+        return icon_photo
+    
+    def _restored_geometry(self) -> str:
+        """Saved window geometry, clamped to the current screen"""
+        saved = safe_json_load(WINDOW_GEOMETRY_FILE).get("geometry", "")
+        match = re.fullmatch(r"(\d+)x(\d+)\+(-?\d+)\+(-?\d+)", saved)
+        if not match:
+            return DEFAULT_GEOMETRY
+        
+        width, height, x, y = map(int, match.groups())
+        screen_width, screen_height = self.winfo_screenwidth(), self.winfo_screenheight()
+        width, height = min(width, screen_width), min(height, screen_height)
+        x = max(0, min(x, screen_width - width))
+        y = max(0, min(y, screen_height - height))
+        return f"{width}x{height}+{x}+{y}"
+    
+    def _save_geometry(self):
+        """Remember the window geometry for the next launch"""
+        # A maximized or minimized size isn't useful to restore
+        if self.state() == "normal":
+            safe_json_save({"geometry": self.geometry()}, WINDOW_GEOMETRY_FILE)
+    
     def apply_theme(self):
         """Apply current theme to all components"""
-        # Re-apply theme to CustomTkinter defaults
-        apply_theme_to_ctk()
+        # Re-apply theme to CustomTkinter defaults (startup may reuse the
+        # overrides cached by the previous launch)
+        apply_theme_to_ctk(use_cache=not self._ui_built)
+        
+        get_color = theme_manager.get_color
+        self._theme = {key: get_color(key) for key in _THEME_SNAPSHOT_KEYS}
+        main_bg = get_color("background.main")
+        sidebar_bg = get_color("sidebar.background")
         
         # Set window background
-        self.configure(fg_color=theme_manager.get_color("background.main"))
+        self.configure(fg_color=main_bg)
+        
+        # Colors for the results context menu
+        self._menu_colors = {
+            "background": main_bg,
+            "foreground": get_color("text.primary"),
+            "activebackground": get_color("buttons.primary_bg"),
+            "activeforeground": get_color("buttons.primary_text"),
+        }
+        if self._results_menu is not None:
+            self._results_menu.configure(**self._menu_colors)
+        
+        # The full-value dialog is rebuilt with the new colors on next use
+        if self._full_cell_dialog is not None:
+            self._full_cell_dialog.destroy()
+            self._full_cell_dialog = None
+        
+        # Nothing else to restyle before the widgets exist
+        if not self._ui_built:
+            return
         
         # Update main interface components if they exist
         if hasattr(self, 'left_frame'):
-            self.left_frame.configure(fg_color=theme_manager.get_color("sidebar.background"))
+            self.left_frame.configure(fg_color=sidebar_bg)
         
         if hasattr(self, 'main_tabs'):
             self.main_tabs.configure(
-                fg_color=theme_manager.get_color("background.main"),
-                segmented_button_fg_color=theme_manager.get_color("sidebar.background"),
-                segmented_button_selected_color=theme_manager.get_color("buttons.primary_bg"),
-                segmented_button_selected_hover_color=theme_manager.get_color("buttons.primary_hover"),
-                segmented_button_unselected_color=theme_manager.get_color("sidebar.background"),
-                segmented_button_unselected_hover_color=theme_manager.get_color("sidebar.header"),
-                text_color=theme_manager.get_color("text.primary"),
-                text_color_disabled=theme_manager.get_color("text.secondary")
+                fg_color=main_bg,
+                segmented_button_fg_color=sidebar_bg,
+                segmented_button_selected_color=get_color("buttons.primary_bg"),
+                segmented_button_selected_hover_color=get_color("buttons.primary_hover"),
+                segmented_button_unselected_color=sidebar_bg,
+                segmented_button_unselected_hover_color=get_color("sidebar.header"),
+                text_color=get_color("text.primary"),
+                text_color_disabled=get_color("text.secondary")
             )
         
         if hasattr(self, 'query_notebook'):
             self.query_notebook.configure(
-                fg_color=theme_manager.get_color("background.main"),
-                segmented_button_fg_color=theme_manager.get_color("sidebar.background")
+                fg_color=main_bg,
+                segmented_button_fg_color=sidebar_bg
             )
         
         if hasattr(self, 'status_frame'):
-            self.status_frame.configure(fg_color=theme_manager.get_color("background.secondary"))
-        
-        # Update schema browser theme
-        if hasattr(self, 'schema_browser'):
-            self.schema_browser.apply_theme()
+            self.status_frame.configure(fg_color=get_color("background.secondary"))
         
-        # Update query panel theme  
-        if hasattr(self, 'query_panel'):
-            self.query_panel.apply_theme()
-            
-        # Update config view theme
-        if hasattr(self, 'config_view'):
-            self.config_view.apply_theme()
+        # Restyle the results table (unchanged styles are skipped)
+        self.configure_results_style()
         
-        # Force UI refresh
-        self.update_idletasks()
+        # Update schema browser, query panel and config view themes, skipping
+        # any panel that is already styled for the current theme
+        theme_name = theme_manager.current_theme_name
+        for attr in ('schema_browser', 'query_panel', 'config_view'):
+            child = getattr(self, attr, None)
+            if child is not None and self._child_themes.get(attr) != theme_name:
+                child.apply_theme()
+                self._child_themes[attr] = theme_name
+    
+    def _schedule_apply_theme(self):
+        """Schedule apply_theme(), collapsing bursts of theme switches into one"""
+        if self._pending_theme_apply:
+            self.after_cancel(self._pending_theme_apply)
+        self._pending_theme_apply = self.after(50, self._do_apply_theme)
+    
+    def _do_apply_theme(self):
+        """Run the debounced apply_theme()"""
+        self._pending_theme_apply = None
+        self.apply_theme()
     
     def switch_theme(self, theme_name: str):
         """Switch to a different theme and update all components"""
@@ -232,11 +524,11 @@ class NeuronDBApp(ctk.CTk):
                 config_manager.set('default_theme', theme_name)
                 config_manager.save_config()
                 
-                # Apply theme to all components
-                self.apply_theme()
+                # Apply theme to all components (coalesced with rapid re-switches)
+                self._schedule_apply_theme()
                 
                 # Also update the config view if it exists
-                if hasattr(self, 'config_view'):
+                if self.config_view is not None:
                     self.config_view.refresh_theme_selector()
                 
                 messagebox.showinfo("Theme Changed", f"Theme switched to: {theme_manager.get_theme_name()}")
@@ -252,71 +544,62 @@ class NeuronDBApp(ctk.CTk):
         menubar = tk.Menu(self)
         self.config(menu=menubar)
         
-        # File menu
-        file_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="File", menu=file_menu)
-        file_menu.add_command(label="New Connection...", command=self.show_connection_dialog)
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.on_closing)
-        
-        # Connection menu
-        connection_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Connection", menu=connection_menu)
-        connection_menu.add_command(label="Connect...", command=self.show_connection_dialog)
-        connection_menu.add_command(label="Disconnect", command=self.disconnect_database)
-        connection_menu.add_separator()
-        connection_menu.add_command(label="Refresh Schema", command=self.refresh_schema)
-        
-        # Query menu
-        query_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Query", menu=query_menu)
-        query_menu.add_command(label="Execute Query", command=self.execute_current_query)
-        query_menu.add_command(label="Clear Query", command=self.clear_query)
-        query_menu.add_separator()
-        query_menu.add_command(label="Format Query", command=self.format_current_query)
-        
-        # AI menu
-        ai_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="AI", menu=ai_menu)
-        ai_menu.add_command(label="Generate Query...", command=self.show_ai_dialog)
-        ai_menu.add_command(label="Explain Query", command=self.explain_current_query)
-        ai_menu.add_separator()
-        ai_menu.add_command(label="Clear Chat History", command=self.clear_ai_history)
-        
-        # Theme menu
+        # File, Connection, Query and AI menus; entries are added the first
+        # time each cascade is posted
+        for menu_label, items in self.MENU_SPEC:
+            menu = tk.Menu(menubar, tearoff=0)
+            menu.configure(postcommand=partial(self._populate_menu, menu, items))
+            menubar.add_cascade(label=menu_label, menu=menu)
+        
+        # Theme menu (scanning the theme directory is deferred the same way)
         theme_menu = tk.Menu(menubar, tearoff=0)
+        theme_menu.configure(postcommand=partial(self._populate_theme_menu, theme_menu))
         menubar.add_cascade(label="Theme", menu=theme_menu)
         
-        # Add available themes to menu
-        from utils.theme_manager import theme_manager
-        available_themes = theme_manager.list_available_themes()
-        theme_display_names = theme_manager.get_theme_display_names()
-        
-        for theme_file in available_themes:
-            display_name = theme_display_names.get(theme_file, theme_file.title())
-            theme_menu.add_command(
-                label=display_name, 
-                command=lambda t=theme_file: self.switch_theme(t)
-            )
-        
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Help", menu=help_menu)
         help_menu.add_command(label="About", command=self.show_about)
     
+    def _populate_menu(self, menu, items):
+        """Fill a MENU_SPEC cascade on its first post"""
+        if menu.index("end") is not None:
+            return
+        for label, method_name in items:
+            if label is None:
+                menu.add_separator()
+            else:
+                menu.add_command(label=label, command=getattr(self, method_name))
+    
+    def _populate_theme_menu(self, menu):
+        """Fill the Theme cascade with the available themes on its first post"""
+        if menu.index("end") is not None:
+            return
+        theme_display_names = theme_manager.get_theme_display_names()
+        for theme_file in theme_manager.list_available_themes():
+            display_name = theme_display_names.get(theme_file, theme_file.title())
+            menu.add_command(
+                label=display_name, 
+                command=partial(self.switch_theme, theme_file)
+            )
+    
     def create_main_interface(self):
         """Create the main interface with tabbed layout"""
+        get_color = theme_manager.get_color
+        sidebar_bg = get_color("sidebar.background")
+        
         # Create main tabbed interface
         self.main_tabs = ctk.CTkTabview(
             self, 
-            fg_color=theme_manager.get_color("background.main"),
-            segmented_button_fg_color=theme_manager.get_color("sidebar.background"),
-            segmented_button_selected_color=theme_manager.get_color("buttons.primary_bg"),
-            segmented_button_selected_hover_color=theme_manager.get_color("buttons.primary_hover"),
-            segmented_button_unselected_color=theme_manager.get_color("sidebar.background"),
-            segmented_button_unselected_hover_color=theme_manager.get_color("sidebar.header"),
-            text_color=theme_manager.get_color("text.primary"),
-            text_color_disabled=theme_manager.get_color("text.secondary")
+            fg_color=get_color("background.main"),
+            segmented_button_fg_color=sidebar_bg,
+            segmented_button_selected_color=get_color("buttons.primary_bg"),
+            segmented_button_selected_hover_color=get_color("buttons.primary_hover"),
+            segmented_button_unselected_color=sidebar_bg,
+            segmented_button_unselected_hover_color=get_color("sidebar.header"),
+            text_color=get_color("text.primary"),
+            text_color_disabled=get_color("text.secondary"),
+            command=self._on_main_tab_change
         )
         self.main_tabs.grid(row=0, column=0, sticky="nsew", padx=10, pady=(10, 0))
         
@@ -328,17 +611,29 @@ class NeuronDBApp(ctk.CTk):
         # Create DB Query tab (current app layout)
         self.create_db_query_tab()
         
-        # Create DB View tab (DBML diagram)
-        self.db_diagram_view = DBDiagramView(self.main_tabs.tab("DB View"))
-        self.db_diagram_view.pack(fill="both", expand=True)
-        
-        # Create Config tab
-        self.config_view = ConfigView(self.main_tabs.tab("Config"), main_window=self)
-        self.config_view.pack(fill="both", expand=True)
+        # DB View (DBML diagram) and Config tabs are built on first selection
+        self.db_diagram_view = None
+        self.config_view = None
+    
+    def _on_main_tab_change(self):
+        """Create the DB View or Config tab contents the first time they are shown"""
+        selected = self.main_tabs.get()
+        
+        if selected == "DB View" and self.db_diagram_view is None:
+            self.db_diagram_view = DBDiagramView(self.main_tabs.tab("DB View"))
+            self.db_diagram_view.pack(fill="both", expand=True)
+        
+        elif selected == "Config" and self.config_view is None:
+            self.config_view = ConfigView(self.main_tabs.tab("Config"), main_window=self)
+            self.config_view.pack(fill="both", expand=True)
+            # Built with the current theme already applied
+            self._child_themes['config_view'] = theme_manager.current_theme_name
     
     def create_db_query_tab(self):
         """Create the DB Query tab with the main query interface"""
         db_query_tab = self.main_tabs.tab("DB Query")
+        get_color = theme_manager.get_color
+        sidebar_bg = get_color("sidebar.background")
         
         # Configure grid for DB Query tab
         db_query_tab.grid_columnconfigure(0, weight=1)
@@ -349,7 +644,7 @@ class NeuronDBApp(ctk.CTk):
         self.main_paned.grid(row=0, column=0, sticky="nsew", padx=0, pady=0)
         
         # Left panel - Schema Browser
-        self.left_frame = ctk.CTkFrame(self.main_paned, width=350, fg_color=theme_manager.get_color("sidebar.background"), corner_radius=8)
+        self.left_frame = ctk.CTkFrame(self.main_paned, width=350, fg_color=sidebar_bg, corner_radius=8)
         self.main_paned.add(self.left_frame, width=350, minsize=280)
         
         # Schema browser (will be fully initialized after query panel)
@@ -365,14 +660,15 @@ class NeuronDBApp(ctk.CTk):
         
         # Create tabbed interface for query tools
         # Query notebook
-        self.query_notebook = ctk.CTkTabview(self.query_frame, fg_color=theme_manager.get_color("editor.background"), 
-                                       segmented_button_fg_color=theme_manager.get_color("sidebar.background"),
-                                       segmented_button_selected_color=theme_manager.get_color("buttons.primary_bg"),
-                                       segmented_button_selected_hover_color=theme_manager.get_color("buttons.primary_hover"),
-                                       segmented_button_unselected_color=theme_manager.get_color("sidebar.background"),
-                                       segmented_button_unselected_hover_color=theme_manager.get_color("sidebar.header"),
-                                       text_color=theme_manager.get_color("text.primary"),
-                                       text_color_disabled="#3E2723")
+        self.query_notebook = ctk.CTkTabview(self.query_frame, fg_color=get_color("editor.background"), 
+                                       segmented_button_fg_color=sidebar_bg,
+                                       segmented_button_selected_color=get_color("buttons.primary_bg"),
+                                       segmented_button_selected_hover_color=get_color("buttons.primary_hover"),
+                                       segmented_button_unselected_color=sidebar_bg,
+                                       segmented_button_unselected_hover_color=get_color("sidebar.header"),
+                                       text_color=get_color("text.primary"),
+                                       text_color_disabled="#3E2723",
+                                       command=self._on_query_tab_change)
         self.query_notebook.pack(fill="both", expand=True, padx=0, pady=0)
         
         # Query tool tab
@@ -401,10 +697,9 @@ class NeuronDBApp(ctk.CTk):
         # Link query panel to schema browser
         self.query_panel.set_schema_browser(self.schema_browser)
         
-        # PSQL terminal tab
+        # PSQL terminal tab (terminal is built on first selection)
         self.query_notebook.add("PSQL Terminal")
-        self.psql_terminal = PSQLTerminal(self.query_notebook.tab("PSQL Terminal"))
-        self.psql_terminal.pack(fill="both", expand=True)
+        self.psql_terminal = None
         
         # Results panel
         self.results_frame = ctk.CTkFrame(self.right_paned, height=400, corner_radius=8)
@@ -413,6 +708,15 @@ class NeuronDBApp(ctk.CTk):
         # Create results display
         self.create_results_display()
     
+    def _on_query_tab_change(self):
+        """Create the PSQL terminal the first time its tab is shown"""
+        if self.query_notebook.get() == "PSQL Terminal" and self.psql_terminal is None:
+            self.psql_terminal = PSQLTerminal(self.query_notebook.tab("PSQL Terminal"))
+            self.psql_terminal.pack(fill="both", expand=True)
+            
+            if self.db_connection.is_connected():
+                self.psql_terminal.set_connection(self.db_connection)
+    
     def create_results_display(self):
         """Create the results display area"""
         # Configure grid
@@ -424,10 +728,12 @@ class NeuronDBApp(ctk.CTk):
         results_header.grid(row=0, column=0, sticky="ew", padx=0, pady=0)
         results_header.grid_columnconfigure(0, weight=1)
         
+        # Header text is bound to a variable so updates skip option parsing
+        self._results_var = tk.StringVar(self, value="Query results will appear here")
         self.results_label = ctk.CTkLabel(
             results_header, 
-            text="Query results will appear here", 
-            font=ctk.CTkFont(size=15, weight="bold"),
+            textvariable=self._results_var, 
+            font=_font(15, "bold"),
             text_color=theme_manager.get_color("sidebar.text")
         )
         self.results_label.grid(row=0, column=0, sticky="w", padx=15, pady=8)
@@ -477,14 +783,14 @@ class NeuronDBApp(ctk.CTk):
             selectmode="extended"
         )
         
-        # Scrollbars for results
-        results_v_scroll = ttk.Scrollbar(table_frame, orient="vertical", command=self.results_tree.yview)
+        # Scrollbars for results; vertical scrolling goes through the row window
+        self.results_v_scroll = ttk.Scrollbar(table_frame, orient="vertical", command=self._on_results_yview)
         results_h_scroll = ttk.Scrollbar(table_frame, orient="horizontal", command=self.results_tree.xview)
-        self.results_tree.configure(yscrollcommand=results_v_scroll.set, xscrollcommand=results_h_scroll.set)
+        self.results_tree.configure(yscrollcommand=self._on_results_yscroll, xscrollcommand=results_h_scroll.set)
         
         # Pack results table and scrollbars
         self.results_tree.grid(row=0, column=0, sticky="nsew", padx=(1, 0), pady=(1, 0))
-        results_v_scroll.grid(row=0, column=1, sticky="ns", pady=(1, 0))
+        self.results_v_scroll.grid(row=0, column=1, sticky="ns", pady=(1, 0))
         results_h_scroll.grid(row=1, column=0, sticky="ew", padx=(1, 0))
         
         # Bind cell selection events
@@ -503,6 +809,19 @@ class NeuronDBApp(ctk.CTk):
         # Current results data
         self.current_results = []
         self.current_columns = []
+        self._results_df = None
+        self._results_arr = None
+        
+        # Formatted rows of a windowed (large) result set and the rendered slice
+        self._display_rows = None
+        self._window_start = 0
+        self._window_stop = 0
+        self._window_rows = RESULTS_WINDOW_ROWS
+        
+        # Window moves requested by scrolling are coalesced into one per idle cycle
+        self._window_job = None
+        self._window_top = 0
+        self.results_tree.bind("<Configure>", self._on_results_configure, add="+")
     
     def create_status_bar(self):
         """Create the status bar"""
@@ -510,97 +829,166 @@ class NeuronDBApp(ctk.CTk):
         self.status_frame.grid(row=1, column=0, sticky="ew", padx=5, pady=(0, 5))
         self.status_frame.grid_columnconfigure(0, weight=1)
         
+        # Status text is bound to a variable so updates skip option parsing
+        self._status_var = tk.StringVar(self, value="Ready")
         self.status_label = ctk.CTkLabel(
             self.status_frame, 
-            text="Ready", 
-            font=ctk.CTkFont(size=11),
+            textvariable=self._status_var, 
+            font=_font(11),
             text_color="#3E2723"
         )
         self.status_label.grid(row=0, column=0, padx=10, pady=5, sticky="w")
+        
+        # Indeterminate activity bar, shown while database jobs are running
+        self.status_progress = ctk.CTkProgressBar(
+            self.status_frame,
+            mode="indeterminate",
+            width=120,
+            height=8,
+            progress_color=theme_manager.get_color("buttons.primary_bg")
+        )
+        self._db_jobs_pending = 0
+    
+    def _submit_db_job(self, job):
+        """Run a database job on the worker pool, with the status bar showing activity"""
+        future = self._db_executor.submit(job)
+        self._db_jobs_pending += 1
+        if self._db_jobs_pending == 1:
+            self.status_progress.grid(row=0, column=1, padx=10, pady=5, sticky="e")
+            self.status_progress.start()
+        future.add_done_callback(lambda f: self.after(0, self._on_db_job_done))
+        return future
+    
+    def _on_db_job_done(self):
+        """Called in main thread after a database job finishes"""
+        self._db_jobs_pending -= 1
+        if self._db_jobs_pending == 0:
+            self.status_progress.stop()
+            self.status_progress.grid_remove()
     
     def configure_results_style(self):
         """Configure results table styling"""
-        style = ttk.Style()
-        
-        # Configure treeview colors using theme
-        style.configure("Treeview", 
-                        background=theme_manager.get_color("table.background"),
-                        foreground=theme_manager.get_color("table.text"),
-                        fieldbackground=theme_manager.get_color("table.background"),
-                        borderwidth=1,
-                        font=("Consolas", 11),
-                        rowheight=25)
-        style.configure("Treeview.Heading",
-                        background=theme_manager.get_color("table.header"),
-                        foreground=theme_manager.get_color("table.text"),
-                        borderwidth=1,
-                        relief="raised",
-                        font=("Consolas", 11, "bold"))
-        style.map("Treeview",
-                  background=[('selected', theme_manager.get_color("table.selected"))],
-                  foreground=[('selected', theme_manager.get_color("text.inverse"))])
-        
-        # Configure scrollbars using theme
-        style.configure("Vertical.TScrollbar", 
-                        background=theme_manager.get_color("scrollbar.thumb"), 
-                        troughcolor=theme_manager.get_color("scrollbar.track"), 
-                        borderwidth=1,
-                        arrowcolor=theme_manager.get_color("scrollbar.arrow"))
-        style.configure("Horizontal.TScrollbar", 
-                        background=theme_manager.get_color("scrollbar.thumb"), 
-                        troughcolor=theme_manager.get_color("scrollbar.track"), 
-                        borderwidth=1,
-                        arrowcolor=theme_manager.get_color("scrollbar.arrow"))
-    
-    def on_results_cell_click(self, event):
-        """Handle single click on results table cell"""
-        # Identify which cell was clicked
-        region = self.results_tree.identify_region(event.x, event.y)
+        style = self._style
+        get_color = theme_manager.get_color
+        
+        # Scrollbars share the same options
+        scrollbar_options = {
+            "background": get_color("scrollbar.thumb"),
+            "troughcolor": get_color("scrollbar.track"),
+            "borderwidth": 1,
+            "arrowcolor": get_color("scrollbar.arrow"),
+        }
+        
+        # Treeview colors and scrollbars using theme
+        styles = {
+            "Treeview": {
+                "background": get_color("table.background"),
+                "foreground": get_color("table.text"),
+                "fieldbackground": get_color("table.background"),
+                "borderwidth": 1,
+                "font": ("Consolas", 11),
+                "rowheight": RESULTS_ROW_HEIGHT,
+            },
+            "Treeview.Heading": {
+                "background": get_color("table.header"),
+                "foreground": get_color("table.text"),
+                "borderwidth": 1,
+                "relief": "raised",
+                "font": ("Consolas", 11, "bold"),
+            },
+            "Vertical.TScrollbar": scrollbar_options,
+            "Horizontal.TScrollbar": scrollbar_options,
+        }
+        
+        # Only push styles to Tk when they differ from what was last applied
+        for name, options in styles.items():
+            if options != self._last_style.get(name):
+                style.configure(name, **options)
+                self._last_style[name] = options
+        
+        treeview_map = {
+            "background": [('selected', get_color("table.selected"))],
+            "foreground": [('selected', get_color("text.inverse"))],
+        }
+        if treeview_map != self._last_style.get("Treeview.map"):
+            style.map("Treeview", **treeview_map)
+            self._last_style["Treeview.map"] = treeview_map
+        
+        # Alternating row colors, set once per theme rather than per result set
+        tree = getattr(self, "results_tree", None)
+        row_tags = {
+            "odd": get_color("table.background"),
+            "even": get_color("background.secondary"),
+        }
+        if tree is not None and row_tags != self._last_style.get("row_tags"):
+            for tag, background in row_tags.items():
+                tree.tag_configure(tag, background=background)
+            self._last_style["row_tags"] = row_tags
+    
+    def _identify_cell(self, event):
+        """Resolve the results cell under the pointer in a single pass
         
-        if region == "cell":
-            # Get the row
-            row_id = self.results_tree.identify_row(event.y)
-            if not row_id:
-                return
-            
-            # Get the column
-            column_id = self.results_tree.identify_column(event.x)
-            if not column_id:
-                return
-            
-            # Convert column_id to column name
-            if column_id == "#0":
-                # Clicked on row number column
-                return
-            
-            # Get column index (columns are #1, #2, etc.)
-            col_index = int(column_id.replace("#", "")) - 1
-            if col_index < 0 or col_index >= len(self.current_columns):
-                return
-            
-            column_name = self.current_columns[col_index]
-            
-            # Get the row data
-            row_index = int(self.results_tree.item(row_id, "text")) - 1
-            if row_index < 0 or row_index >= len(self.current_results):
-                return
-            
-            # Get cell value
+        Returns (row_index, column_name, cell_value), or None when the event
+        is not over a data cell.
+        """
+        tree = self.results_tree
+        
+        # Identify which cell was clicked
+        if tree.identify_region(event.x, event.y) != "cell":
+            return None
+        
+        # Get the row
+        row_id = tree.identify_row(event.y)
+        if not row_id:
+            return None
+        
+        # Get the column; "#0" is the row number column
+        column_id = tree.identify_column(event.x)
+        if not column_id or column_id == "#0":
+            return None
+        
+        # Get column index (columns are #1, #2, etc.)
+        col_index = int(column_id[1:]) - 1
+        if col_index < 0 or col_index >= len(self.current_columns):
+            return None
+        
+        # Rows are inserted with their index as the item id
+        row_index = int(row_id)
+        if row_index < 0 or row_index >= len(self.current_results):
+            return None
+        
+        # Get cell value, from the 2D object array for large result sets
+        column_name = self.current_columns[col_index]
+        if self._results_arr is not None:
+            cell_value = self._results_arr[row_index, col_index]
+        else:
             cell_value = self.current_results[row_index].get(column_name, "")
-            
-            # Store selected cell info
-            self.selected_cell_row = row_index
-            self.selected_cell_column = column_name
-            self.selected_cell_value = cell_value
-            
-            # Update status bar to show selected cell info
-            value_preview = str(cell_value)
-            if len(value_preview) > 50:
-                value_preview = value_preview[:47] + "..."
-            
-            self.status_label.configure(
-                text=f"Selected: Row {row_index + 1}, {column_name} = {value_preview}"
-            )
+        return row_index, column_name, cell_value
+    
+    def on_results_cell_click(self, event, cell=_UNSET):
+        """Handle single click on results table cell
+        
+        Callers that already resolved the cell can pass it as ``cell``, even
+        when it resolved to None.
+        """
+        if cell is _UNSET:
+            cell = self._identify_cell(event)
+        if cell is None:
+            return
+        
+        row_index, column_name, cell_value = cell
+        
+        # Store selected cell info
+        self.selected_cell_row = row_index
+        self.selected_cell_column = column_name
+        self.selected_cell_value = cell_value
+        
+        # Update status bar to show selected cell info
+        value_preview = str(cell_value)
+        if len(value_preview) > 50:
+            value_preview = value_preview[:47] + "..."
+        
+        self._status_var.set(f"Selected: Row {row_index + 1}, {column_name} = {value_preview}")
     
     def on_results_cell_double_click(self, event):
         """Handle double-click on results table cell to copy value"""
@@ -610,47 +998,40 @@ class NeuronDBApp(ctk.CTk):
             self.clipboard_append(str(self.selected_cell_value))
             
             # Show confirmation
-            self.status_label.configure(
-                text=f"Copied to clipboard: {self.selected_cell_column}"
-            )
+            self._status_var.set(f"Copied to clipboard: {self.selected_cell_column}")
             
             # Flash the status bar
-            self.after(2000, lambda: self.status_label.configure(text="Ready"))
+            self.after(2000, partial(self._status_var.set, "Ready"))
     
     def on_results_right_click(self, event):
         """Handle right-click on results table cell - show context menu"""
         # First, select the cell
-        self.on_results_cell_click(event)
+        self.on_results_cell_click(event, self._identify_cell(event))
         
         if self.selected_cell_value is None:
             return
         
-        # Create context menu
-        context_menu = tk.Menu(self, tearoff=0)
-        context_menu.configure(
-            background=theme_manager.get_color("background.main"),
-            foreground=theme_manager.get_color("text.primary"),
-            activebackground=theme_manager.get_color("buttons.primary_bg"),
-            activeforeground=theme_manager.get_color("buttons.primary_text"),
-            font=("Segoe UI", 10)
-        )
-        
-        context_menu.add_command(
-            label=f"📋 Copy Cell ({self.selected_cell_column})",
-            command=self.copy_selected_cell
-        )
-        
-        context_menu.add_command(
-            label="📄 Copy Row",
-            command=self.copy_selected_row
-        )
-        
-        context_menu.add_separator()
+        # Create the context menu on first use, then only relabel it
+        context_menu = self._results_menu
+        if context_menu is None:
+            context_menu = self._results_menu = tk.Menu(self, tearoff=0)
+            context_menu.configure(**self._menu_colors, font=("Segoe UI", 10))
+            
+            context_menu.add_command(label="", command=self.copy_selected_cell)
+            
+            context_menu.add_command(
+                label="📄 Copy Row",
+                command=self.copy_selected_row
+            )
+            
+            context_menu.add_separator()
+            
+            context_menu.add_command(
+                label="📊 View Full Value",
+                command=self.view_full_cell_value
+            )
         
-        context_menu.add_command(
-            label="📊 View Full Value",
-            command=self.view_full_cell_value
-        )
+        context_menu.entryconfigure(0, label=f"📋 Copy Cell ({self.selected_cell_column})")
         
         # Show menu at cursor position
         try:
@@ -663,8 +1044,8 @@ class NeuronDBApp(ctk.CTk):
         if self.selected_cell_value is not None:
             self.clipboard_clear()
             self.clipboard_append(str(self.selected_cell_value))
-            self.status_label.configure(text=f"✓ Copied: {self.selected_cell_column}")
-            self.after(2000, lambda: self.status_label.configure(text="Ready"))
+            self._status_var.set(f"✓ Copied: {self.selected_cell_column}")
+            self.after(2000, partial(self._status_var.set, "Ready"))
     
     def copy_selected_row(self):
         """Copy the entire selected row to clipboard"""
@@ -672,90 +1053,153 @@ class NeuronDBApp(ctk.CTk):
             row_data = self.current_results[self.selected_cell_row]
             
             # Format as tab-separated values
-            row_values = [str(row_data.get(col, "")) for col in self.current_columns]
+            get = row_data.get
+            columns = self.current_columns
+            row_values = [str(get(col, "")) for col in columns]
             row_text = "\t".join(row_values)
             
             self.clipboard_clear()
             self.clipboard_append(row_text)
-            self.status_label.configure(text=f"✓ Copied row {self.selected_cell_row + 1}")
-            self.after(2000, lambda: self.status_label.configure(text="Ready"))
+            self._status_var.set(f"✓ Copied row {self.selected_cell_row + 1}")
+            self.after(2000, partial(self._status_var.set, "Ready"))
     
     def view_full_cell_value(self):
         """Show the full cell value in a dialog"""
         if self.selected_cell_value is None:
             return
         
-        # Create a dialog to show full value
-        dialog = tk.Toplevel(self)
+        if self._full_cell_dialog is None:
+            self._build_full_cell_dialog()
+        dialog = self._full_cell_dialog
+        value_text = str(self.selected_cell_value)
+        
         dialog.title(f"Cell Value: {self.selected_cell_column}")
-        dialog.geometry("600x400")
-        dialog.configure(bg=theme_manager.get_color("background.main"))
+        self._full_cell_title.configure(text=f"📊 Row {self.selected_cell_row + 1} • {self.selected_cell_column}")
+        
+        if len(value_text) <= MAX_CELL_DISPLAY_LEN and "\n" not in value_text:
+            # Short single-line values only need a wrapping label
+            self._full_cell_text_frame.pack_forget()
+            self._full_cell_label.configure(text=value_text)
+            self._full_cell_label.pack(fill="both", expand=True, padx=12, pady=12, before=self._full_cell_buttons)
+        else:
+            # Text widget sized to the wrapped content, scrollbar only when it doesn't fit
+            wrapped_lines = sum(len(line) // CELL_DIALOG_CHARS + 1 for line in value_text.split("\n"))
+            
+            text_widget = self._full_cell_text
+            text_widget.configure(state="normal", height=min(wrapped_lines, CELL_DIALOG_LINES))
+            text_widget.delete("1.0", tk.END)
+            text_widget.insert("1.0", value_text)
+            text_widget.configure(state="disabled")
+            
+            if wrapped_lines > CELL_DIALOG_LINES:
+                self._full_cell_scrollbar.pack(side="right", fill="y")
+            else:
+                self._full_cell_scrollbar.pack_forget()
+            
+            self._full_cell_label.pack_forget()
+            self._full_cell_text_frame.pack(fill="both", expand=True, padx=12, pady=12, before=self._full_cell_buttons)
+        
+        self._full_cell_copy_btn.configure(
+            command=lambda: [self.clipboard_clear(),
+                             self.clipboard_append(value_text),
+                             self._status_var.set("✓ Copied to clipboard")]
+        )
+        
+        # Center over the main window, clamped to stay on screen
+        width, height = 600, 400
+        x = max(10, min(self.winfo_rootx() + (self.winfo_width() - width) // 2,
+                        self.winfo_screenwidth() - width - 10))
+        y = max(10, min(self.winfo_rooty() + (self.winfo_height() - height) // 2,
+                        self.winfo_screenheight() - height - 10))
+        dialog.geometry(f"{width}x{height}+{x}+{y}")
         
         # Make it modal
-        dialog.transient(self)
+        dialog.deiconify()
+        dialog.lift()
         dialog.grab_set()
+    
+    def _build_full_cell_dialog(self):
+        """Create the full-value dialog once; later opens only refill it"""
+        theme = self._theme
+        
+        dialog = tk.Toplevel(self)
+        dialog.withdraw()
+        dialog.configure(bg=theme["background.main"])
+        dialog.transient(self)
+        dialog.protocol("WM_DELETE_WINDOW", self._close_full_cell_dialog)
         
         # Title label
-        title_frame = ctk.CTkFrame(dialog, fg_color=theme_manager.get_color("buttons.primary_bg"))
+        title_frame = ctk.CTkFrame(dialog, fg_color=theme["buttons.primary_bg"])
         title_frame.pack(fill="x", padx=0, pady=0)
         
-        title_label = ctk.CTkLabel(
+        self._full_cell_title = ctk.CTkLabel(
             title_frame,
-            text=f"📊 Row {self.selected_cell_row + 1} • {self.selected_cell_column}",
-            font=ctk.CTkFont(size=12, weight="bold"),
-            text_color=theme_manager.get_color("buttons.primary_text")
+            text="",
+            font=_font(12, "bold"),
+            text_color=theme["buttons.primary_text"]
+        )
+        self._full_cell_title.pack(pady=8, padx=12)
+        
+        # Label for short values
+        self._full_cell_label = ctk.CTkLabel(
+            dialog,
+            text="",
+            font=("Consolas", 11),
+            text_color=theme["text.primary"],
+            fg_color=theme["editor.background"],
+            wraplength=540,
+            justify="left",
+            anchor="nw"
         )
-        title_label.pack(pady=8, padx=12)
         
-        # Text widget to show value
-        text_frame = tk.Frame(dialog, bg=theme_manager.get_color("editor.background"))
-        text_frame.pack(fill="both", expand=True, padx=12, pady=12)
+        # Text widget and scrollbar for long values
+        self._full_cell_text_frame = tk.Frame(dialog, bg=theme["editor.background"])
         
-        text_widget = tk.Text(
-            text_frame,
+        self._full_cell_text = tk.Text(
+            self._full_cell_text_frame,
             wrap="word",
-            bg=theme_manager.get_color("editor.background"),
-            fg=theme_manager.get_color("text.primary"),
+            bg=theme["editor.background"],
+            fg=theme["text.primary"],
             font=("Consolas", 11),
             padx=10,
             pady=10
         )
-        text_widget.pack(side="left", fill="both", expand=True)
+        self._full_cell_text.pack(side="left", fill="both", expand=True)
         
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(text_frame, orient="vertical", command=text_widget.yview)
-        scrollbar.pack(side="right", fill="y")
-        text_widget.configure(yscrollcommand=scrollbar.set)
-        
-        # Insert value
-        text_widget.insert("1.0", str(self.selected_cell_value))
-        text_widget.configure(state="disabled")
+        self._full_cell_scrollbar = ttk.Scrollbar(
+            self._full_cell_text_frame, orient="vertical", command=self._full_cell_text.yview
+        )
+        self._full_cell_text.configure(yscrollcommand=self._full_cell_scrollbar.set)
         
         # Button frame
-        button_frame = ctk.CTkFrame(dialog, fg_color="transparent")
-        button_frame.pack(fill="x", padx=12, pady=(0, 12))
+        self._full_cell_buttons = ctk.CTkFrame(dialog, fg_color="transparent")
+        self._full_cell_buttons.pack(side="bottom", fill="x", padx=12, pady=(0, 12))
         
-        copy_btn = ctk.CTkButton(
-            button_frame,
+        self._full_cell_copy_btn = ctk.CTkButton(
+            self._full_cell_buttons,
             text="📋 Copy",
-            command=lambda: [self.clipboard_clear(), 
-                           self.clipboard_append(str(self.selected_cell_value)),
-                           self.status_label.configure(text="✓ Copied to clipboard")],
-            fg_color=theme_manager.get_color("button.background"),
-            hover_color=theme_manager.get_color("button.hoverBackground"),
+            fg_color=theme["button.background"],
+            hover_color=theme["button.hoverBackground"],
             width=100
         )
-        copy_btn.pack(side="left", padx=5)
+        self._full_cell_copy_btn.pack(side="left", padx=5)
         
         close_btn = ctk.CTkButton(
-            button_frame,
+            self._full_cell_buttons,
             text="Close",
-            command=dialog.destroy,
-            fg_color=theme_manager.get_color("button.hoverBackground"),
-            hover_color=theme_manager.get_color("sideBarSectionHeader.background"),
+            command=self._close_full_cell_dialog,
+            fg_color=theme["button.hoverBackground"],
+            hover_color=theme["sideBarSectionHeader.background"],
             width=100
         )
         close_btn.pack(side="left", padx=5)
+        
+        self._full_cell_dialog = dialog
+    
+    def _close_full_cell_dialog(self):
+        """Hide the full-value dialog so the next open can reuse it"""
+        self._full_cell_dialog.grab_release()
+        self._full_cell_dialog.withdraw()
     
     def display_results_callback(self, results, columns):
         """Callback to display results from query panel"""
@@ -763,16 +1207,19 @@ class NeuronDBApp(ctk.CTk):
     
     def display_results(self, results, columns):
         """Display query results in the main results area"""
-        # Clear existing results
-        self.clear_results()
+        # Clear existing results; plain table rows are kept for the new ones to reuse
+        self.clear_results(keep_rows=bool(results and columns))
         
         if not results or not columns:
-            self.results_label.configure(text="Query results will appear here")
+            self._results_var.set("Query results will appear here")
             return
         
-        # Store current results
+        # Store current results; large sets also get a columnar copy whose
+        # object array backs cell lookups with one slot per value
         self.current_results = results
         self.current_columns = columns
+        if len(results) >= COLUMNAR_RESULTS_THRESHOLD:
+            self._results_arr = self._get_results_df().to_numpy()
         
         # Configure tree column for row numbers
         self.results_tree.column("#0", width=50, minwidth=50, anchor="center", stretch=False)
@@ -781,87 +1228,262 @@ class NeuronDBApp(ctk.CTk):
         # Configure columns
         self.results_tree["columns"] = columns
         
+        if len(results) <= SMALL_RESULTS_ROWS:
+            # Small sets aren't worth building a DataFrame for; widths come
+            # from the formatted sample, where empty cells don't count
+            rows, content_widths = self._format_small_rows()
+        else:
+            # Estimate content widths from the first few rows in one vectorized
+            # pass; empty cells don't count
+            import numpy as np
+            sample = self._get_results_df().iloc[:20]
+            lengths = sample.astype(str).apply(lambda col: col.str.len()).where(sample.notna(), 0).to_numpy(dtype=int)
+            content_widths = np.where(lengths <= 10, lengths * 12, np.where(lengths <= 50, lengths * 10, 300)).max(axis=0)
+            rows = None
+        
         # Set column headings and widths
-        for col in columns:
+        for col, content_width in zip(columns, content_widths):
             self.results_tree.heading(col, text=col, anchor="w")
-            # Calculate column width based on content
             header_width = len(col) * 12
-            max_width = max(120, header_width)
-            
-            if results:
-                # Sample first few rows to estimate width
-                sample_rows = results[:min(20, len(results))]
-                for row in sample_rows:
-                    if col in row and row[col] is not None:
-                        content_length = len(str(row[col]))
-                        if content_length <= 10:
-                            content_width = content_length * 12
-                        elif content_length <= 50:
-                            content_width = content_length * 10
-                        else:
-                            content_width = 300
-                        max_width = max(max_width, content_width)
+            max_width = max(120, header_width, content_width)
             
             # Cap maximum and minimum widths
             max_width = min(max(max_width, 80), 400)
-            self.results_tree.column(col, width=max_width, anchor="w", minwidth=80)
-        
-        # Insert data
-        for i, row in enumerate(results):
-            values = []
-            for col in columns:
-                value = row.get(col, "")
-                # Handle None values
-                if value is None:
-                    value = "[NULL]"
-                # Handle different data types
-                elif isinstance(value, (list, dict)):
-                    value = str(value)
-                    if len(value) > 200:
-                        value = value[:197] + "..."
-                # Truncate very long text values for display
-                elif isinstance(value, str):
-                    if len(value) > 200:
-                        value = value[:197] + "..."
-                    # Replace newlines and tabs for better display
-                    value = value.replace('\n', ' ').replace('\t', ' ').replace('\r', ' ')
-                # Handle other types
-                else:
-                    value = str(value)
-                    if len(value) > 200:
-                        value = value[:197] + "..."
-                
-                values.append(value)
-            
-            # Add alternating row colors by using tags
-            tag = "odd" if i % 2 == 1 else "even"
-            # Insert with row number in the tree column
-            self.results_tree.insert("", "end", text=str(i + 1), values=values, tags=(tag,))
-        
-        # Configure row tags for better readability using theme colors
-        self.results_tree.tag_configure("odd", background=theme_manager.get_color("table.background"))
-        self.results_tree.tag_configure("even", background=theme_manager.get_color("background.secondary"))
+            self.results_tree.column(col, width=int(max_width), anchor="w", minwidth=80)
         
-        # Update results label
-        self.results_label.configure(text=f"Results ({len(results)} rows)")
+        # Clean every column with vectorized string ops (unless the small path
+        # already did), then hand the rows to the tree; this also keeps the
+        # results label up to date
+        self.populate_results(rows if rows is not None else self._format_result_rows())
         
         # Enable export buttons
         self.export_csv_btn.configure(state="normal" if results else "disabled")
         self.export_excel_btn.configure(state="normal" if results else "disabled")
     
-    def clear_results(self):
-        """Clear the results table"""
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
+    def populate_results(self, rows):
+        """Replace the results table rows with pre-formatted values"""
+        tree = self.results_tree
+        self._cancel_results_insert()
+        
+        # Any existing rows are ids 0..n-1 in order; the ones the first chunk
+        # below overwrites right away are kept, the rest (or all of them, for a
+        # windowed set) go so no stale values show under the new headers
+        children = tree.get_children()
+        keep = min(len(children), len(rows), RESULTS_INSERT_CHUNK)
+        if self._display_rows is not None or len(rows) >= RESULTS_VIRTUAL_THRESHOLD:
+            keep = 0
+        if len(children) > keep:
+            tree.delete(*children[keep:])
+        if keep:
+            tree.selection_remove(tree.selection())
+            tree.yview_moveto(0)
+        self._display_rows = None
+        
+        if len(rows) >= RESULTS_VIRTUAL_THRESHOLD:
+            # Very large sets only render a window of rows around the view
+            self._display_rows = rows
+            self._window_start = self._window_stop = 0
+            self._move_results_window(0)
+            self._results_var.set(f"Results ({len(rows)} rows)")
+        else:
+            # Others go in a chunk per idle cycle so the window stays responsive
+            self._insert_results_chunk(rows, 0)
+    
+    def _insert_result_rows(self, rows, start, stop, index="end"):
+        """Insert rows[start:stop] into the results table at the given position"""
+        # Flatten to (id, row number, values, tag) groups and insert them all
+        # with a single Tcl call; tuples reach Tcl as native lists, so no
+        # per-row Python option processing or manual quoting is needed
+        flat = []
+        extend = flat.extend
+        for i in range(start, stop):
+            # Alternating row colors use tags; row number goes in the tree column
+            extend((i, i + 1, tuple(rows[i]), "odd" if i % 2 == 1 else "even"))
+        
+        if flat:
+            tree = self.results_tree
+            tree.tk.call("apply", _TCL_BULK_INSERT, str(tree), tuple(flat), index)
+    
+    def _insert_results_chunk(self, rows, start):
+        """Insert the next chunk of result rows and schedule the one after it"""
+        total = len(rows)
+        stop = min(start + RESULTS_INSERT_CHUNK, total)
+        self._insert_result_rows(rows, start, stop)
+        
+        if stop < total:
+            self._results_var.set(f"Results (loading {stop}/{total} rows)")
+            self._results_insert_job = self.after_idle(self._insert_results_chunk, rows, stop)
+        else:
+            self._results_insert_job = None
+            self._results_var.set(f"Results ({total} rows)")
+    
+    def _move_results_window(self, top):
+        """Render the window of rows around row `top` and scroll it into view"""
+        rows = self._display_rows
+        total = len(rows)
+        new_start = max(0, min(top - self._window_rows // 2, total - self._window_rows))
+        new_stop = min(total, new_start + self._window_rows)
+        start, stop = self._window_start, self._window_stop
+        tree = self.results_tree
+        
+        # Item ids are row indices, so only the rows leaving and entering change
+        if new_start >= stop or new_stop <= start:
+            tree.delete(*tree.get_children())
+            self._insert_result_rows(rows, new_start, new_stop)
+        else:
+            leaving = [*range(start, min(new_start, stop)), *range(max(new_stop, start), stop)]
+            if leaving:
+                tree.delete(*leaving)
+            self._insert_result_rows(rows, new_start, min(start, new_stop), index=0)
+            self._insert_result_rows(rows, max(stop, new_start), new_stop)
+        
+        self._window_start, self._window_stop = new_start, new_stop
+        tree.yview_moveto((top - new_start) / (new_stop - new_start))
+    
+    def _on_results_yview(self, *args):
+        """Vertical scrollbar command; positions refer to the whole result set"""
+        rows = self._display_rows
+        if rows is None or args[0] != "moveto":
+            self.results_tree.yview(*args)
+            return
+        
+        total = len(rows)
+        top = min(int(float(args[1]) * total), total - 1)
+        start, stop = self._window_start, self._window_stop
+        if start <= top and top + self._window_rows // 4 <= stop:
+            self._cancel_window_move()
+            self.results_tree.yview_moveto((top - start) / (stop - start))
+        else:
+            self._request_window_move(max(top, 0))
+    
+    def _on_results_yscroll(self, first, last):
+        """Tree scroll updates; maps the rendered window onto the scrollbar"""
+        rows = self._display_rows
+        if rows is None:
+            self.results_v_scroll.set(first, last)
+            return
+        
+        total = len(rows)
+        start, stop = self._window_start, self._window_stop
+        span = stop - start
+        first_row = start + float(first) * span
+        last_row = start + float(last) * span
+        self.results_v_scroll.set(first_row / total, last_row / total)
+        
+        # Slide the window before the view reaches either end of it
+        margin = self._window_rows // 4
+        if (start > 0 and first_row - start < margin) or (stop < total and stop - last_row < margin):
+            self._request_window_move(int(first_row))
+    
+    def _request_window_move(self, top):
+        """Move the row window to `top` on the next idle cycle, keeping only the latest request"""
+        self._window_top = top
+        if self._window_job is None:
+            self._window_job = self.after_idle(self._flush_window_move)
+    
+    def _flush_window_move(self):
+        """Apply the most recent window move request"""
+        self._window_job = None
+        if self._display_rows is not None:
+            self._move_results_window(self._window_top)
+    
+    def _cancel_window_move(self):
+        """Drop a window move that has not run yet"""
+        if self._window_job is not None:
+            self.after_cancel(self._window_job)
+            self._window_job = None
+    
+    def _on_results_configure(self, event):
+        """Size the rendered row window to the table's visible height"""
+        visible_rows = event.height // RESULTS_ROW_HEIGHT + 1
+        window_rows = max(RESULTS_MIN_WINDOW_ROWS, visible_rows * RESULTS_WINDOW_SCREENS)
+        if window_rows == self._window_rows:
+            return
+        
+        self._window_rows = window_rows
+        if self._display_rows is not None:
+            # Re-render around the row currently at the top of the view
+            first = self.results_tree.yview()[0]
+            top = self._window_start + int(first * (self._window_stop - self._window_start))
+            self._move_results_window(top)
+    
+    def _cancel_results_insert(self):
+        """Stop a chunked insert or window move that is still in progress"""
+        if self._results_insert_job is not None:
+            self.after_cancel(self._results_insert_job)
+            self._results_insert_job = None
+        self._cancel_window_move()
+    
+    def clear_results(self, keep_rows=False):
+        """Clear the results table
+        
+        With ``keep_rows`` the rows of a non-windowed table stay in place so
+        the next result set can overwrite them instead of recreating them.
+        """
+        self._cancel_results_insert()
+        if not keep_rows or self._display_rows is not None:
+            self.results_tree.delete(*self.results_tree.get_children())
         
         self.results_tree["columns"] = ()
-        self.results_label.configure(text="Query results will appear here")
+        self._results_var.set("Query results will appear here")
         self.export_csv_btn.configure(state="disabled")
         self.export_excel_btn.configure(state="disabled")
         
         # Clear stored data
         self.current_results = []
         self.current_columns = []
+        self._results_df = None
+        self._results_arr = None
+        self._display_rows = None
+    
+    def _format_result_rows(self):
+        """Display strings for the current results as a 2-D object array"""
+        df = self._get_results_df()
+        nulls = df.isna().to_numpy()
+        text = df.astype(str)
+        
+        for i in range(text.shape[1]):
+            col = text.iloc[:, i]
+            too_long = col.str.len() > MAX_CELL_DISPLAY_LEN
+            if too_long.any():
+                col = col.where(~too_long, col.str.slice(0, MAX_CELL_DISPLAY_LEN - 3) + "...")
+            text.iloc[:, i] = col.str.translate(_WS_TABLE)
+        
+        rows = text.to_numpy(dtype=object)
+        rows[nulls] = "[NULL]"
+        return rows
+    
+    def _format_small_rows(self):
+        """Display strings and content widths for a small result set, without pandas"""
+        columns = self.current_columns
+        widths = [0] * len(columns)
+        rows = []
+        for index, values in enumerate(map(_row_picker(columns), self.current_results)):
+            row = []
+            for col, value in enumerate(values):
+                if value is None or (isinstance(value, float) and value != value):
+                    row.append("[NULL]")
+                    continue
+                text = str(value)
+                if index < 20:
+                    widths[col] = max(widths[col], _content_width(len(text)))
+                if len(text) > MAX_CELL_DISPLAY_LEN:
+                    text = text[:MAX_CELL_DISPLAY_LEN - 3] + "..."
+                row.append(text.translate(_WS_TABLE))
+            rows.append(row)
+        return rows, widths
+    
+    def _get_results_df(self):
+        """Columnar copy of the current results, built on demand for small sets"""
+        if self._results_df is None:
+            import pandas as pd
+            # Value tuples in column order skip pandas' per-row dict key
+            # alignment; object dtype skips type inference
+            columns = self.current_columns
+            self._results_df = pd.DataFrame(
+                list(map(_row_picker(columns), self.current_results)), columns=columns, dtype=object
+            )
+        return self._results_df
     
     def export_csv(self):
         """Export query results to CSV"""
@@ -869,8 +1491,6 @@ class NeuronDBApp(ctk.CTk):
             messagebox.showwarning("No Results", "No query results to export")
             return
         
-        from tkinter import filedialog
-        
         # Ask for save location
         filename = filedialog.asksaveasfilename(
             defaultextension=".csv",
@@ -881,25 +1501,30 @@ class NeuronDBApp(ctk.CTk):
         if not filename:
             return
         
-        try:
-            import csv
-            
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=self.current_columns)
-                writer.writeheader()
+        results = self.current_results
+        columns = self.current_columns
+        
+        def _export_thread():
+            """Thread function for writing the CSV file"""
+            try:
+                total = len(results)
+                # Stream value tuples through csv.writer, which writes None as an empty field
+                with open(filename, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(columns)
+                    pick = _row_picker(columns)
+                    for start in range(0, total, EXPORT_PROGRESS_ROWS):
+                        writer.writerows(map(pick, results[start:start + EXPORT_PROGRESS_ROWS]))
+                        done = min(start + EXPORT_PROGRESS_ROWS, total)
+                        self.after(0, self.update_status, f"Exporting... {done * 100 // total}%")
                 
-                for row in self.current_results:
-                    # Handle None values and convert all to strings
-                    clean_row = {}
-                    for col in self.current_columns:
-                        value = row.get(col)
-                        clean_row[col] = "" if value is None else str(value)
-                    writer.writerow(clean_row)
-            
-            messagebox.showinfo("Export Complete", f"Results exported to:\n{filename}")
-            
-        except Exception as e:
-            messagebox.showerror("Export Error", f"Failed to export results:\n{e}")
+                self.after(0, self._on_export_success, "Results exported to", filename)
+            except Exception as e:
+                self.after(0, self._on_export_error, f"Failed to export results:\n{e}")
+        
+        self.update_status("Exporting...")
+        thread = threading.Thread(target=_export_thread, daemon=True)
+        thread.start()
     
     def export_excel(self):
         """Export query results to Excel"""
@@ -918,72 +1543,140 @@ class NeuronDBApp(ctk.CTk):
             return
         
         try:
-            # Convert results to DataFrame
-            data = []
-            for row in self.current_results:
-                clean_row = {}
-                for col in self.current_columns:
-                    value = row.get(col)
-                    clean_row[col] = value  # Keep original types for Excel
-                data.append(clean_row)
-            
-            df = pd.DataFrame(data, columns=self.current_columns)
-            
-            # Create Excel writer with formatting
-            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                # Write data to Excel
-                df.to_excel(writer, sheet_name='Query Results', index=False)
-                
-                # Get the workbook and worksheet
-                workbook = writer.book
-                worksheet = writer.sheets['Query Results']
-                
-                # Auto-adjust column widths
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
+            import xlsxwriter
+        except ImportError:
+            xlsxwriter = None
+        
+        results = self.current_results
+        columns = self.current_columns
+        # openpyxl goes through pandas; object dtype keeps original types for Excel
+        df = self._get_results_df() if xlsxwriter is None else None
+        
+        def _export_thread():
+            """Thread function for writing the Excel workbook"""
+            try:
+                if xlsxwriter is not None:
+                    # Stream rows straight from the results; constant_memory keeps
+                    # only the current row in memory
+                    workbook = xlsxwriter.Workbook(filename, {
+                        'constant_memory': True,
+                        'remove_timezone': True,
+                        'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+                    })
+                    worksheet = workbook.add_worksheet('Query Results')
                     
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
+                    # Style the header row
+                    header_format = workbook.add_format({
+                        'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#0078D4',
+                        'align': 'center', 'valign': 'vcenter'
+                    })
+                    worksheet.write_row(0, 0, columns, header_format)
                     
-                    adjusted_width = min(max_length + 2, 50)  # Max width of 50
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
-                
-                # Style the header row
-                from openpyxl.styles import Font, PatternFill, Alignment
-                
-                header_font = Font(bold=True, color="FFFFFF")
-                header_fill = PatternFill(start_color="0078D4", end_color="0078D4", fill_type="solid")
-                center_alignment = Alignment(horizontal="center", vertical="center")
+                    # Column widths are tracked as a running max while writing
+                    widths = [len(str(col)) for col in columns]
+                    write_row = worksheet.write_row
+                    pick = _row_picker(columns)
+                    for row_index, row in enumerate(results, 1):
+                        values = [_excel_value(value) for value in pick(row)]
+                        write_row(row_index, 0, values)
+                        widths = list(map(max, widths, map(_excel_width, values)))
+                    
+                    for index, width in enumerate(widths):
+                        worksheet.set_column(index, index, min(width + 2, 50))  # Max width of 50
+                    workbook.close()
+                else:
+                    import numpy as np
+                    import pandas as pd
+                    
+                    # Column widths from the frame rather than the written cells
+                    header_lengths = df.columns.astype(str).str.len().to_numpy()
+                    value_lengths = df.astype(str).apply(lambda col: col.str.len().max()).fillna(0).to_numpy()
+                    widths = np.minimum(np.maximum(header_lengths, value_lengths) + 2, 50)  # Max width of 50
+                    
+                    # Create Excel writer with formatting
+                    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+                        # Write data to Excel
+                        df.to_excel(writer, sheet_name='Query Results', index=False)
+                        
+                        # Get the workbook and worksheet
+                        workbook = writer.book
+                        worksheet = writer.sheets['Query Results']
+                        
+                        # Auto-adjust column widths
+                        from openpyxl.utils import get_column_letter
+                        
+                        for index, width in enumerate(widths, 1):
+                            worksheet.column_dimensions[get_column_letter(index)].width = int(width)
+                        
+                        # Style the header row
+                        from openpyxl.styles import Font, PatternFill, Alignment
+                        
+                        header_font = Font(bold=True, color="FFFFFF")
+                        header_fill = PatternFill(start_color="0078D4", end_color="0078D4", fill_type="solid")
+                        center_alignment = Alignment(horizontal="center", vertical="center")
+                        
+                        for cell in worksheet[1]:  # Header row
+                            cell.font = header_font
+                            cell.fill = header_fill
+                            cell.alignment = center_alignment
                 
-                for cell in worksheet[1]:  # Header row
-                    cell.font = header_font
-                    cell.fill = header_fill
-                    cell.alignment = center_alignment
-            
-            messagebox.showinfo("Export Complete", f"Results exported to Excel:\n{filename}")
-            
-        except ImportError:
-            messagebox.showerror("Export Error", "Excel export requires 'openpyxl' package.\nPlease install it with: pip install openpyxl")
-        except Exception as e:
-            messagebox.showerror("Export Error", f"Failed to export results to Excel:\n{e}")
+                self.after(0, self._on_export_success, "Results exported to Excel", filename)
+            except ImportError:
+                self.after(0, self._on_export_error, "Excel export requires 'xlsxwriter' or 'openpyxl'.\nPlease install one with: pip install xlsxwriter")
+            except Exception as e:
+                self.after(0, self._on_export_error, f"Failed to export results to Excel:\n{e}")
+        
+        self.update_status("Exporting to Excel...")
+        thread = threading.Thread(target=_export_thread, daemon=True)
+        thread.start()
+    
+    def _on_export_success(self, message: str, filename: str):
+        """Called in main thread after an export finishes"""
+        self.update_status("Export complete")
+        messagebox.showinfo("Export Complete", f"{message}:\n{filename}")
+    
+    def _on_export_error(self, error_message: str):
+        """Called in main thread after an export fails"""
+        self.update_status("Export failed")
+        messagebox.showerror("Export Error", error_message)
     
     def init_ai_assistant(self):
-        """Initialize the AI assistant"""
-        try:
-            self.ai_assistant = NeuronDBAI()
-            self.logger.info("AI assistant initialized successfully")
-        except Exception as e:
-            self.logger.error(f"Failed to initialize AI assistant: {e}")
-            messagebox.showwarning(
-                "AI Assistant", 
-                f"Failed to initialize AI assistant:\n{e}\n\n"
-                "Please check your GOOGLE_API_KEY in .env file"
-            )
+        """Initialize the AI assistant in the background"""
+        def _init_ai_thread():
+            """Thread function for AI assistant initialization"""
+            try:
+                # Imported here so the Gemini SDK loads off the startup path
+                from ai.assistant import NeuronDBAI
+                assistant = NeuronDBAI()
+                self.after(0, self._on_ai_ready, assistant)
+            except Exception as e:
+                self.after(0, self._on_ai_error, str(e))
+        
+        self._ai_loading = True
+        thread = threading.Thread(target=_init_ai_thread, daemon=True)
+        thread.start()
+    
+    def _on_ai_ready(self, assistant):
+        """Called in main thread once the AI assistant is initialized"""
+        self._ai_loading = False
+        self.ai_assistant = assistant
+        self.schema_browser.ai_assistant = assistant
+        
+        # A schema may have loaded while the assistant was starting
+        if self.current_schema:
+            assistant.set_database_schema(self.current_schema)
+        
+        self.logger.info("AI assistant initialized successfully")
+    
+    def _on_ai_error(self, error_message: str):
+        """Called in main thread after AI assistant initialization fails"""
+        self._ai_loading = False
+        self.logger.error(f"Failed to initialize AI assistant: {error_message}")
+        messagebox.showwarning(
+            "AI Assistant", 
+            f"Failed to initialize AI assistant:\n{error_message}\n\n"
+            "Please check your GOOGLE_API_KEY in .env file"
+        )
     
     def show_connection_dialog(self):
         """Show connection dialog"""
@@ -1021,10 +1714,9 @@ class NeuronDBApp(ctk.CTk):
                 # Update UI in main thread
                 self.after(0, self._on_connection_error, str(e))
         
-        # Update status and start connection in background thread
+        # Update status and start connection on a worker
         self.update_status("Connecting to database...")
-        thread = threading.Thread(target=_connect_thread, daemon=True)
-        thread.start()
+        self._submit_db_job(_connect_thread)
     
     def _on_connection_success(self, connection_config: Dict[str, Any]):
         """Called in main thread after successful connection"""
@@ -1038,8 +1730,9 @@ class NeuronDBApp(ctk.CTk):
             self.refresh_schema()
             
             # Update PSQL terminal
-            self.logger.info("[UI] Updating PSQL terminal...")
-            self.psql_terminal.set_connection(self.db_connection)
+            if self.psql_terminal is not None:
+                self.logger.info("[UI] Updating PSQL terminal...")
+                self.psql_terminal.set_connection(self.db_connection)
             
             self.update_status("Connected successfully")
             self.logger.info(f"[UI] ✅ Connected to database: {connection_config['database']}")
@@ -1074,7 +1767,8 @@ class NeuronDBApp(ctk.CTk):
                 self.ai_assistant.set_database_schema({})
             
             # Update PSQL terminal
-            self.psql_terminal.clear_connection()
+            if self.psql_terminal is not None:
+                self.psql_terminal.clear_connection()
             
             self.update_status("Disconnected")
             self.logger.info("[UI] ✅ Disconnected from database successfully")
@@ -1108,10 +1802,9 @@ class NeuronDBApp(ctk.CTk):
                 # Update UI in main thread
                 self.after(0, self._on_schema_error, str(e))
         
-        # Update status and start schema fetch in background thread
+        # Update status and start schema fetch on a worker
         self.update_status("Loading database schema...")
-        thread = threading.Thread(target=_refresh_schema_thread, daemon=True)
-        thread.start()
+        self._submit_db_job(_refresh_schema_thread)
     
     def _on_schema_loaded(self, schema: Dict[str, Any]):
         """Called in main thread after schema is loaded"""
@@ -1143,23 +1836,23 @@ class NeuronDBApp(ctk.CTk):
     
     def execute_current_query(self):
         """Execute the current query from query panel"""
-        if hasattr(self.query_panel, 'execute_query'):
-            self.query_panel.execute_query()
+        self.query_panel.execute_query()
     
     def clear_query(self):
         """Clear the current query"""
-        if hasattr(self.query_panel, 'clear_query'):
-            self.query_panel.clear_query()
+        self.query_panel.clear_query()
     
     def format_current_query(self):
         """Format the current query"""
-        if hasattr(self.query_panel, 'format_query'):
-            self.query_panel.format_query()
+        self.query_panel.format_query()
     
     def show_ai_dialog(self):
         """Show AI query generation dialog"""
         if not self.ai_assistant:
-            messagebox.showwarning("AI Not Available", "AI assistant is not configured")
+            if self._ai_loading:
+                self.update_status("AI assistant is still loading...")
+            else:
+                messagebox.showwarning("AI Not Available", "AI assistant is not configured")
             return
         
         # This would open an AI chat dialog - simplified for now
@@ -1168,42 +1861,27 @@ class NeuronDBApp(ctk.CTk):
             "Describe what you want to query:"
         )
         
-        if user_input and hasattr(self.query_panel, 'generate_with_ai'):
+        if user_input:
             self.query_panel.generate_with_ai(user_input)
     
     def explain_current_query(self):
         """Explain the current query using AI"""
-        if hasattr(self.query_panel, 'explain_query'):
-            self.query_panel.explain_query()
+        self.query_panel.explain_query()
     
     def clear_ai_history(self):
         """Clear AI conversation history"""
         if self.ai_assistant:
             self.ai_assistant.clear_conversation_history()
             messagebox.showinfo("AI History", "Conversation history cleared")
+        elif self._ai_loading:
+            self.update_status("AI assistant is still loading...")
     
     def show_about(self):
         """Show about dialog"""
-        about_text = """NeuronDB - AI-Powered PostgreSQL Client
-
-Version: 1.0.0
-
-A modern desktop application that brings AI assistance to PostgreSQL database management.
-
-Features:
-• AI-powered query generation with Google Gemini
-• Visual schema browser
-• Advanced query editor with saved queries
-• Built-in PSQL terminal
-• Connection management
-• Excel export support
-
-Built with Python, CustomTkinter, and LangChain.
-"""
-        messagebox.showinfo("About NeuronDB", about_text)
+        messagebox.showinfo("About NeuronDB", _ABOUT_TEXT)
     
     def execute_query_callback(self, query: str):
-        """Callback for executing queries from query panel"""
+        """Callback for executing queries from query panel (called on its worker thread)"""
         if not self.db_connection.is_connected():
             return None, "Not connected to database"
         
@@ -1215,12 +1893,19 @@ Built with Python, CustomTkinter, and LangChain.
     
     def execute_query(self):
         """Execute the current query in the query panel"""
-        if hasattr(self.query_panel, 'execute_query'):
-            self.query_panel.execute_query()
+        self.query_panel.execute_query()
     
     def ai_generate_callback(self, user_input: str):
         """Callback for AI query generation"""
+        # Structural requests don't need the model
+        for pattern, build_sql in _TRIVIAL_AI_PATTERNS:
+            match = pattern.match(user_input)
+            if match:
+                return build_sql(match), None
+        
         if not self.ai_assistant:
+            if self._ai_loading:
+                return None, "AI assistant is still loading, please try again in a moment"
             return None, "AI assistant not available"
         
         try:
@@ -1234,37 +1919,73 @@ Built with Python, CustomTkinter, and LangChain.
     
     def on_table_select(self, table_name: str):
         """Handle table selection from schema browser"""
-        if hasattr(self.query_panel, 'insert_table_name'):
-            self.query_panel.insert_table_name(table_name)
+        self.query_panel.insert_table_name(table_name)
     
     def on_saved_query_select(self, query_text: str):
         """Handle saved query selection from schema browser"""
-        if hasattr(self.query_panel, 'append_query'):
-            self.query_panel.append_query(query_text)
-            self.update_status("Saved query appended to editor")
+        self.query_panel.append_query(query_text)
+        self.update_status("Saved query appended to editor")
+    
+    def update_status(self, message: str, immediate: bool = False):
+        """Update status bar message; bursts of updates only paint the last one"""
+        self._pending_status = message
+        if immediate:
+            self._flush_status()
+        elif self._status_job is None:
+            self._status_job = self.after(STATUS_DEBOUNCE_MS, self._flush_status)
     
-    def update_status(self, message: str):
-        """Update status bar message"""
-        self.status_label.configure(text=message)
-        self.update_idletasks()
+    def _flush_status(self):
+        """Show the most recent status message"""
+        if self._status_job is not None:
+            self.after_cancel(self._status_job)
+            self._status_job = None
+        self._status_var.set(self._pending_status)
     
     def on_closing(self):
         """Handle application closing"""
         try:
             self.logger.info("Application closing initiated...")
+            self._save_geometry()
             
-            # Disconnect from database if connected
-            if self.db_connection and self.db_connection.is_connected():
-                self.logger.info("Closing database connection...")
-                self.update_status("Disconnecting from database...")
-                self.db_connection.disconnect()
-                self.logger.info("✅ Database connection closed successfully")
+            # Stop accepting background work and drop queued jobs (e.g. a pending
+            # schema refresh) before the connection goes away; running jobs
+            # finish on their own
+            self._db_executor.shutdown(wait=False, cancel_futures=True)
+            self.query_panel.shutdown()
             
-            # Clean up AI assistant if exists
+            # Clean up AI assistant if exists; deleting the Gemini schema cache
+            # is a network call, so it runs alongside the disconnect below
+            release_thread = None
             if self.ai_assistant:
                 self.logger.info("Cleaning up AI assistant...")
+                release_thread = threading.Thread(target=self.ai_assistant.release_context_cache, daemon=True)
+                release_thread.start()
                 self.ai_assistant = None
             
+            # Disconnect from database if connected; an unreachable server
+            # can stall the close, so it gets a bounded wait
+            # Checked without is_connected(): its probe could block on a dead
+            # server before the bounded wait below even starts
+            deadline = monotonic() + SHUTDOWN_TIMEOUT
+            if self.db_connection and self.db_connection.connection is not None:
+                self.logger.info("Closing database connection...")
+                self.update_status("Disconnecting from database...", immediate=True)
+                # Paint it before blocking on the disconnect below
+                self.update_idletasks()
+                disconnect_thread = threading.Thread(target=self.db_connection.disconnect, daemon=True)
+                disconnect_thread.start()
+                disconnect_thread.join(timeout=max(0.0, deadline - monotonic()))
+                if disconnect_thread.is_alive():
+                    self.logger.warning("Database disconnect timed out, closing anyway")
+                else:
+                    self.logger.info("✅ Database connection closed successfully")
+            
+            # The cache delete shares the same bounded wait
+            if release_thread is not None:
+                release_thread.join(timeout=max(0.0, deadline - monotonic()))
+                if release_thread.is_alive():
+                    self.logger.warning("AI context cache release timed out, leaving it to expire")
+            
             self.logger.info("NeuronDB application closed")
             self.destroy()
             
@@ -9,8 +9,89 @@ import subprocess
 import threading
 import queue
 import os
+import re
+import io
+import codecs
+import atexit
+import weakref
+from collections import deque
+from itertools import groupby
+from operator import itemgetter
 from typing import Optional
 
+# Number of distinct commands kept in the input history
+HISTORY_SIZE = 100
+
+# Text tags for colored terminal output, configured once per widget
+TERMINAL_TAGS = {
+    "error": "#CD853F",
+    "command": "#8B7355",  # Brown for commands
+}
+
+# Bytes requested from psql's stdout per read
+READ_CHUNK_SIZE = 65536
+
+# Rows psql fetches per batch in streaming mode, so large results print as they arrive
+STREAM_FETCH_COUNT = 1000
+
+# ANSI escape sequences (colors, cursor control) that the Text widget can't render
+_ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+
+# Lines kept in the terminal display; older output is trimmed from the top
+MAX_TERMINAL_LINES = 5000
+
+# Common PSQL commands offered to the user
+COMMON_COMMANDS = (
+    "\\l",  # List databases
+    "\\dt",  # List tables
+    "\\d",  # Describe table
+    "\\du",  # List users
+    "\\dn",  # List schemas
+    "\\df",  # List functions
+    "\\dv",  # List views
+    "\\di",  # List indexes
+    "\\q",  # Quit
+    "\\h",  # Help
+    "\\?",  # List commands
+    "SELECT version();",
+    "SELECT current_database();",
+    "SELECT current_user;",
+    "SHOW ALL;",
+)
+
+# Help text written to the terminal by show_help()
+HELP_TEXT = """
+Common PSQL Commands:
+\\l          - List all databases
+\\dt         - List tables in current database
+\\d [table]  - Describe table structure
+\\du         - List database users
+\\dn         - List schemas
+\\df         - List functions
+\\dv         - List views
+\\di         - List indexes
+\\q          - Quit PSQL
+\\h [cmd]    - Help on SQL command
+\\?          - List all PSQL commands
+
+Navigation:
+- Use Up/Down arrows to navigate command history
+- Use Tab for auto-completion (if supported)
+- Semicolon (;) ends SQL statements
+
+SQL Examples:
+SELECT * FROM table_name LIMIT 10;
+INSERT INTO table_name (col1, col2) VALUES ('val1', 'val2');
+UPDATE table_name SET col1 = 'new_value' WHERE condition;
+DELETE FROM table_name WHERE condition;
+"""
+
+def _call_weak_method(method_ref):
+    """Call a weakly referenced method if its object is still alive"""
+    method = method_ref()
+    if method is not None:
+        method()
+
 class PSQLTerminal(ctk.CTkFrame):
     """Interactive PSQL terminal interface"""
     
@@ -20,9 +101,23 @@ class PSQLTerminal(ctk.CTkFrame):
         self.connection = None
         self.process = None
         self.output_queue = queue.Queue()
-        self.command_history = []
+        # Encoded input for the running psql, written by its writer thread
+        self.input_queue = None
+        # Oldest commands fall off the deque; the set makes the duplicate check O(1)
+        self.command_history = deque(maxlen=HISTORY_SIZE)
+        self._history_set = set()
         self.history_index = -1
         
+        # Terminal writes waiting for the next idle flush, as (text, tag) pairs
+        self._pending = []
+        self._flush_job = None
+        
+        # Set by the reader thread once it has asked the UI to drain output_queue
+        self._drain_scheduled = False
+        
+        # Make sure psql doesn't outlive the app, without atexit keeping us alive
+        atexit.register(_call_weak_method, weakref.WeakMethod(self._safe_shutdown))
+        
         # Create UI components
         self.create_widgets()
     
@@ -44,6 +139,16 @@ class PSQLTerminal(ctk.CTkFrame):
         )
         self.header_label.grid(row=0, column=0, sticky="w", padx=15, pady=10)
         
+        # Streaming mode: unaligned output fetched in batches, so large results
+        # start printing before psql has read (and sized) every row
+        self.stream_switch = ctk.CTkSwitch(
+            header_frame,
+            text="Stream output",
+            command=self._on_stream_toggle
+        )
+        self.stream_switch.select()
+        self.stream_switch.grid(row=0, column=1, padx=12, pady=10)
+        
         # Connect button
         self.connect_btn = ctk.CTkButton(
             header_frame, 
@@ -54,7 +159,7 @@ class PSQLTerminal(ctk.CTkFrame):
             state="disabled",
             corner_radius=6
         )
-        self.connect_btn.grid(row=0, column=1, padx=12, pady=10)
+        self.connect_btn.grid(row=0, column=2, padx=12, pady=10)
         
         # Disconnect button
         self.disconnect_btn = ctk.CTkButton(
@@ -66,7 +171,7 @@ class PSQLTerminal(ctk.CTkFrame):
             state="disabled",
             corner_radius=6
         )
-        self.disconnect_btn.grid(row=0, column=2, padx=8, pady=10)
+        self.disconnect_btn.grid(row=0, column=3, padx=8, pady=10)
         
         # Clear button
         self.clear_btn = ctk.CTkButton(
@@ -77,7 +182,7 @@ class PSQLTerminal(ctk.CTkFrame):
             height=32,
             corner_radius=6
         )
-        self.clear_btn.grid(row=0, column=3, padx=(8, 15), pady=10)
+        self.clear_btn.grid(row=0, column=4, padx=(8, 15), pady=10)
         
         # Terminal area
         terminal_frame = ctk.CTkFrame(self, corner_radius=8)
@@ -104,6 +209,9 @@ class PSQLTerminal(ctk.CTkFrame):
             pady=5
         )
         
+        for tag_name, color in TERMINAL_TAGS.items():
+            self.terminal_text.tag_configure(tag_name, foreground=color)
+        
         # Scrollbar
         terminal_scroll = ttk.Scrollbar(terminal_frame, command=self.terminal_text.yview)
         self.terminal_text.configure(yscrollcommand=terminal_scroll.set)
@@ -184,7 +292,7 @@ class PSQLTerminal(ctk.CTkFrame):
     def connect_psql(self):
         """Connect to PSQL process"""
         if not self.connection or not self.connection.is_connected():
-            self.write_to_terminal("Error: No database connection available.\n", color="#CD853F")
+            self.write_to_terminal("Error: No database connection available.\n", tag="error")
             return
         
         if self.process and self.process.poll() is None:
@@ -207,7 +315,7 @@ class PSQLTerminal(ctk.CTkFrame):
                 )
                 
                 if not password:
-                    self.write_to_terminal("Connection cancelled: Password required.\n", color="#CD853F")
+                    self.write_to_terminal("Connection cancelled: Password required.\n", tag="error")
                     return
             
             # Construct psql command
@@ -216,50 +324,94 @@ class PSQLTerminal(ctk.CTkFrame):
                 "-h", conn_info['host'],
                 "-p", str(conn_info['port']),
                 "-U", conn_info['username'],
-                "-d", conn_info['database']
+                "-d", conn_info['database'],
+                # Skip ~/.psqlrc and never hand output to a pager; output goes
+                # to a pipe, not a terminal
+                "-X",
+                "--pset=pager=off",
             ]
+            if self.stream_switch.get():
+                cmd += ["-A", f"--set=FETCH_COUNT={STREAM_FETCH_COUNT}"]
             
-            # Set environment for password
+            # Set environment for password. psql inherits the full environment:
+            # an allow-list would drop variables libpq and the dynamic loader
+            # rely on (PGSERVICEFILE, PGSSLROOTCERT, LD_LIBRARY_PATH, KRB5CCNAME...)
             env = os.environ.copy()
             env['PGPASSWORD'] = password
+            # Output is decoded as UTF-8 by the reader thread
+            env['PGCLIENTENCODING'] = 'UTF8'
             
-            # Start psql process
-            self.process = subprocess.Popen(
+            # Starting psql can take a while (process creation, PATH lookup),
+            # so it happens off the UI thread
+            self.connect_btn.configure(state="disabled")
+            thread = threading.Thread(target=self._spawn_psql, args=(cmd, env, conn_info), daemon=True)
+            thread.start()
+            
+        except Exception as e:
+            self.write_to_terminal(f"Error connecting to PSQL: {e}\n", tag="error")
+    
+    def _spawn_psql(self, cmd, env, conn_info):
+        """Thread function for starting the psql process"""
+        try:
+            process = subprocess.Popen(
                 cmd,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
+                bufsize=0,
                 env=env
             )
-            
-            # Start output reader thread
-            self.start_output_reader()
-            
-            # Update UI
-            self.connect_btn.configure(state="disabled")
-            self.disconnect_btn.configure(state="normal")
-            self.command_entry.configure(state="normal")
-            self.send_btn.configure(state="normal")
-            
-            self.write_to_terminal(f"Connected to PSQL: {conn_info['database']}@{conn_info['host']}:{conn_info['port']}\n")
-            
-            # Focus on command input
-            self.command_entry.focus()
-            
         except FileNotFoundError:
-            self.write_to_terminal("Error: 'psql' command not found. Please ensure PostgreSQL client is installed and in PATH.\n", color="#CD853F")
+            self.after(0, self._on_psql_failed, "Error: 'psql' command not found. Please ensure PostgreSQL client is installed and in PATH.\n")
         except Exception as e:
-            self.write_to_terminal(f"Error connecting to PSQL: {e}\n", color="#CD853F")
+            self.after(0, self._on_psql_failed, f"Error connecting to PSQL: {e}\n")
+        else:
+            self.after(0, self._on_psql_started, process, conn_info)
+    
+    def _on_psql_started(self, process, conn_info):
+        """Called in main thread once the psql process is running"""
+        # The database connection was cleared while psql was starting
+        if self.connection is None:
+            process.terminate()
+            return
+        
+        self.process = process
+        
+        # Start output reader and input writer threads
+        self.start_output_reader()
+        self.start_input_writer()
+        
+        # Update UI
+        self.disconnect_btn.configure(state="normal")
+        self.command_entry.configure(state="normal")
+        self.send_btn.configure(state="normal")
+        
+        self.write_to_terminal(f"Connected to PSQL: {conn_info['database']}@{conn_info['host']}:{conn_info['port']}\n")
+        
+        # Focus on command input
+        self.command_entry.focus()
+    
+    def _on_psql_failed(self, message):
+        """Called in main thread when psql could not be started"""
+        self.write_to_terminal(message, tag="error")
+        self.connect_btn.configure(state="normal" if self.connection else "disabled")
+    
+    def _on_stream_toggle(self):
+        """Switch a running psql session between streaming and aligned output"""
+        if self.input_queue is None:
+            return
+        if self.stream_switch.get():
+            commands = f"\\pset format unaligned\n\\set FETCH_COUNT {STREAM_FETCH_COUNT}\n"
+        else:
+            commands = "\\pset format aligned\n\\unset FETCH_COUNT\n"
+        self.input_queue.put(commands.encode("utf-8"))
     
     def disconnect_psql(self):
         """Disconnect from PSQL process"""
         if self.process and self.process.poll() is None:
             try:
                 # Send quit command
-                self.process.stdin.write("\\q\n")
-                self.process.stdin.flush()
+                self.input_queue.put(b"\\q\n")
                 
                 # Wait for process to terminate
                 self.process.wait(timeout=5)
@@ -271,6 +423,11 @@ class PSQLTerminal(ctk.CTkFrame):
             
             self.process = None
         
+        # Let the writer thread finish once anything queued has been sent
+        if self.input_queue is not None:
+            self.input_queue.put(None)
+            self.input_queue = None
+        
         # Update UI
         self.connect_btn.configure(state="normal" if self.connection else "disabled")
         self.disconnect_btn.configure(state="disabled")
@@ -281,53 +438,89 @@ class PSQLTerminal(ctk.CTkFrame):
     
     def start_output_reader(self):
         """Start thread to read PSQL output"""
+        process = self.process
+        
+        def put_output(text):
+            """Queue output and wake the UI, once per burst of lines"""
+            self.output_queue.put(text)
+            if not self._drain_scheduled:
+                self._drain_scheduled = True
+                self.after(0, self.process_output)
+        
         def read_output():
+            # Reads take whatever is in the pipe (up to READ_CHUNK_SIZE), so bulk
+            # output arrives in large pieces and prompts without a newline show
+            # up immediately; the decoder carries split characters and CRLFs over
+            decoder = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True
+            )
+            fd = process.stdout.fileno()
             try:
-                while self.process and self.process.poll() is None:
-                    line = self.process.stdout.readline()
-                    if line:
-                        self.output_queue.put(line)
-                    
-                # Read any remaining output
-                if self.process:
-                    remaining = self.process.stdout.read()
-                    if remaining:
-                        self.output_queue.put(remaining)
-                        
+                # Blocks until psql writes; no polling while it is idle
+                while True:
+                    chunk = os.read(fd, READ_CHUNK_SIZE)
+                    text = decoder.decode(chunk, final=not chunk)
+                    if text:
+                        put_output(text)
+                    if not chunk:
+                        break
             except Exception as e:
-                self.output_queue.put(f"Error reading output: {e}\n")
+                put_output(f"Error reading output: {e}\n")
+            
+            # stdout closed: psql has exited or is being disconnected
+            self.after(0, self._on_output_closed, process)
         
         # Start reader thread
         thread = threading.Thread(target=read_output, daemon=True)
         thread.start()
-        
-        # Start output processor
-        self.process_output()
     
-    def process_output(self):
-        """Process output from PSQL"""
-        try:
+    def start_input_writer(self):
+        """Start thread to write commands to PSQL; a full stdin pipe blocks it, not the UI"""
+        process = self.process
+        input_queue = self.input_queue = queue.Queue()
+        
+        def write_input():
             while True:
+                data = input_queue.get()
+                if data is None:
+                    break
                 try:
-                    line = self.output_queue.get_nowait()
-                    self.write_to_terminal(line)
-                except queue.Empty:
+                    # stdin is unbuffered, so a write may take only part of
+                    # a long paste; keep going until all of it is sent
+                    view = memoryview(data)
+                    while view:
+                        view = view[process.stdin.write(view):]
+                except Exception as e:
+                    # psql has gone away; its output reader reports the exit
+                    self.after(0, self.write_to_terminal, f"Error executing command: {e}\n", "error")
                     break
-        except Exception:
-            pass
         
-        # Schedule next check
-        if self.process and self.process.poll() is None:
-            self.after(100, self.process_output)
-        else:
-            # Process has ended
-            if self.process:
-                self.disconnect_psql()
+        thread = threading.Thread(target=write_input, daemon=True)
+        thread.start()
+    
+    def process_output(self):
+        """Process output from PSQL"""
+        # Reset first so output queued while draining schedules another pass
+        self._drain_scheduled = False
+        while True:
+            try:
+                line = self.output_queue.get_nowait()
+            except queue.Empty:
+                break
+            self.write_to_terminal(line)
+    
+    def _on_output_closed(self, process):
+        """Called in main thread when a psql process' output ends"""
+        self.process_output()
+        
+        # Process has ended on its own (not through disconnect_psql)
+        if self.process is process:
+            self.disconnect_psql()
     
     def execute_command(self, event=None):
         """Execute a command in PSQL"""
         if not self.process or self.process.poll() is not None:
-            self.write_to_terminal("Error: PSQL is not running.\n", color="#CD853F")
+            self.write_to_terminal("Error: PSQL is not running.\n", tag="error")
             return
         
         command = self.command_entry.get().strip()
@@ -336,26 +529,25 @@ class PSQLTerminal(ctk.CTkFrame):
         
         try:
             # Add to history
-            if command not in self.command_history:
+            if command not in self._history_set:
+                if len(self.command_history) == HISTORY_SIZE:
+                    self._history_set.discard(self.command_history[0])
                 self.command_history.append(command)
-                # Keep only last 100 commands
-                if len(self.command_history) > 100:
-                    self.command_history.pop(0)
+                self._history_set.add(command)
             
             self.history_index = len(self.command_history)
             
             # Display command in terminal
-            self.write_to_terminal(f"psql> {command}\n", color="#8B7355")  # Brown for commands
+            self.write_to_terminal(f"psql> {command}\n", tag="command")
             
             # Send command to PSQL
-            self.process.stdin.write(command + "\n")
-            self.process.stdin.flush()
+            self.input_queue.put((command + "\n").encode("utf-8"))
             
             # Clear input
             self.command_entry.delete(0, tk.END)
             
         except Exception as e:
-            self.write_to_terminal(f"Error executing command: {e}\n", color="#CD853F")
+            self.write_to_terminal(f"Error executing command: {e}\n", tag="error")
     
     def history_up(self, event):
         """Navigate up in command history"""
@@ -375,27 +567,45 @@ class PSQLTerminal(ctk.CTkFrame):
                 self.history_index = len(self.command_history)
                 self.command_entry.delete(0, tk.END)
     
-    def write_to_terminal(self, text: str, color: Optional[str] = None):
-        """Write text to terminal display"""
-        self.terminal_text.configure(state=tk.NORMAL)
+    def write_to_terminal(self, text: str, tag: Optional[str] = None):
+        """Write text to terminal display; writes are batched until the next idle cycle
         
-        if color:
-            # Create tag for colored text
-            tag_name = f"color_{color}"
-            self.terminal_text.tag_configure(tag_name, foreground=color)
-            self.terminal_text.insert(tk.END, text, tag_name)
-        else:
-            self.terminal_text.insert(tk.END, text)
+        ``tag`` is one of TERMINAL_TAGS, or None for default-colored text.
+        """
+        self._pending.append((text, tag))
+        if self._flush_job is None:
+            self._flush_job = self.after_idle(self._flush_pending)
+    
+    def _flush_pending(self):
+        """Insert all pending writes with one insert per tag run and a single scroll"""
+        self._flush_job = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
         
-        # Auto-scroll to bottom
-        self.terminal_text.see(tk.END)
-        self.terminal_text.configure(state=tk.DISABLED)
+        terminal_text = self.terminal_text
+        terminal_text.configure(state=tk.NORMAL)
         
-        # Update display
-        self.terminal_text.update_idletasks()
+        for tag, run in groupby(pending, key=itemgetter(1)):
+            text = "".join(map(itemgetter(0), run))
+            # Strip escapes once per run, and only when there are any
+            if "\x1b" in text:
+                text = _ANSI_ESCAPE_RE.sub("", text)
+            terminal_text.insert(tk.END, text, tag or ())
+        
+        # Keep the widget bounded so inserts and scrolling stay cheap
+        lines = int(terminal_text.index("end-1c").split(".")[0])
+        if lines > MAX_TERMINAL_LINES:
+            terminal_text.delete("1.0", f"{lines - MAX_TERMINAL_LINES + 1}.0")
+        
+        # Auto-scroll to bottom
+        terminal_text.see(tk.END)
+        terminal_text.configure(state=tk.DISABLED)
     
     def clear_terminal(self):
         """Clear the terminal display"""
+        # Output that hasn't been drawn yet is cleared along with the rest
+        self._pending.clear()
         self.terminal_text.configure(state=tk.NORMAL)
         self.terminal_text.delete(1.0, tk.END)
         self.terminal_text.configure(state=tk.DISABLED)
@@ -409,59 +619,24 @@ class PSQLTerminal(ctk.CTkFrame):
         self.command_entry.insert(0, command)
         self.command_entry.focus()
     
-    def get_common_commands(self) -> list:
+    def get_common_commands(self) -> tuple:
         """Get list of common PSQL commands"""
-        return [
-            "\\l",  # List databases
-            "\\dt",  # List tables
-            "\\d",  # Describe table
-            "\\du",  # List users
-            "\\dn",  # List schemas
-            "\\df",  # List functions
-            "\\dv",  # List views
-            "\\di",  # List indexes
-            "\\q",  # Quit
-            "\\h",  # Help
-            "\\?",  # List commands
-            "SELECT version();",
-            "SELECT current_database();",
-            "SELECT current_user;",
-            "SHOW ALL;",
-        ]
+        return COMMON_COMMANDS
     
     def show_help(self):
         """Show PSQL help information"""
-        help_text = """
-Common PSQL Commands:
-\\l          - List all databases
-\\dt         - List tables in current database
-\\d [table]  - Describe table structure
-\\du         - List database users
-\\dn         - List schemas
-\\df         - List functions
-\\dv         - List views
-\\di         - List indexes
-\\q          - Quit PSQL
-\\h [cmd]    - Help on SQL command
-\\?          - List all PSQL commands
-
-Navigation:
-- Use Up/Down arrows to navigate command history
-- Use Tab for auto-completion (if supported)
-- Semicolon (;) ends SQL statements
-
-SQL Examples:
-SELECT * FROM table_name LIMIT 10;
-INSERT INTO table_name (col1, col2) VALUES ('val1', 'val2');
-UPDATE table_name SET col1 = 'new_value' WHERE condition;
-DELETE FROM table_name WHERE condition;
-"""
-        self.write_to_terminal(help_text)
+        self.write_to_terminal(HELP_TEXT)
     
-    def __del__(self):
-        """Cleanup when object is destroyed"""
-        if self.process and self.process.poll() is None:
+    def _safe_shutdown(self):
+        """Terminate a psql process that is still running"""
+        process = self.process
+        if process and process.poll() is None:
             try:
-                self.process.terminate()
-            except:
-                pass
\ No newline at end of file
+                process.terminate()
+            except Exception:
+                pass
+    
+    def destroy(self):
+        """Stop psql along with the widget"""
+        self._safe_shutdown()
+        super().destroy()
\ No newline at end of file
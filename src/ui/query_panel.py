@@ -6,16 +6,19 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import customtkinter as ctk
 from typing import Dict, Any, Callable, Optional, List, Tuple
-import threading
 import time
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import re
-import sys
-from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
 from utils.theme_manager import theme_manager
 
+@lru_cache(maxsize=256)
+def _cached_format(query: str) -> str:
+    """Formatted SQL, reused while the same text is formatted again"""
+    from utils.helpers import format_sql_query
+    return format_sql_query(query)
+
 class QueryPanel(ctk.CTkFrame):
     """Query panel with SQL editor and AI assistant"""
     
@@ -28,10 +31,18 @@ class QueryPanel(ctk.CTkFrame):
         self.results_callback = results_callback  # Callback to display results in main window
         self.schema_browser = schema_browser  # Reference to schema browser for saved queries
         
+        # Workers for query execution, AI generation and table-name fetches;
+        # per panel, so shutting one panel down leaves the others running
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="query")
+        
         # Current state
         self.current_results = []
         self.current_columns = []
         
+        # Editor text as of the last get_current_query(); valid while the Text
+        # widget's modified flag stays clear
+        self._cached_query = None
+        
         # Autocomplete state
         self.autocomplete_popup = None
         self.autocomplete_listbox = None
@@ -380,8 +391,7 @@ SELECT version();"""
                 self.after(0, lambda: self.handle_query_error(str(e), execution_time))
         
         # Start background execution
-        thread = threading.Thread(target=execute_in_background, daemon=True)
-        thread.start()
+        self._executor.submit(execute_in_background)
     
     def execute_all_query(self):
         """Execute all text in the query editor (Play button ▶)"""
@@ -441,8 +451,7 @@ SELECT version();"""
                 self.after(0, lambda: self.handle_selected_query_error(str(e), execution_time))
         
         # Start background execution
-        thread = threading.Thread(target=execute_in_background, daemon=True)
-        thread.start()
+        self._executor.submit(execute_in_background)
     
     def handle_selected_query_result(self, results: Optional[List[Dict]], columns_or_error, execution_time: float, query: str):
         """Handle successful selected query execution result"""
@@ -536,8 +545,12 @@ SELECT version();"""
         if had_suggestion:
             self.clear_keyword_suggestion()
         
-        # Get the actual query text
-        query = self.query_text.get("1.0", tk.END).strip()
+        # Get the actual query text, re-reading the buffer only if it changed
+        # since the last call (any insert or delete sets the modified flag)
+        if self._cached_query is None or self.query_text.edit_modified():
+            self._cached_query = self.query_text.get("1.0", tk.END).strip()
+            self.query_text.edit_modified(False)
+        query = self._cached_query
         
         # Note: We don't restore the suggestion here as it will be regenerated on next key press
         
@@ -577,9 +590,10 @@ SELECT version();"""
             return
         
         try:
-            from utils.helpers import format_sql_query
-            formatted_query = format_sql_query(query)
-            self.set_query(formatted_query)
+            formatted_query = _cached_format(query)
+            # Already formatted text doesn't need the editor rewritten
+            if formatted_query != query:
+                self.set_query(formatted_query)
             self.query_info.configure(text="Query formatted")
         except ImportError:
             messagebox.showwarning("Format Error", "SQL formatting not available")
@@ -616,8 +630,7 @@ SELECT version();"""
             except Exception as e:
                 self.after(0, lambda: self.handle_ai_error(str(e)))
         
-        thread = threading.Thread(target=generate_in_background, daemon=True)
-        thread.start()
+        self._executor.submit(generate_in_background)
     
     def handle_ai_result(self, query: Optional[str], error: Optional[str], user_input: str):
         """Handle AI generation result"""
@@ -758,6 +771,10 @@ SELECT version();"""
         """Set reference to schema browser"""
         self.schema_browser = schema_browser
     
+    def shutdown(self):
+        """Stop accepting background work and drop jobs that haven't started"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
     # ====== AUTOCOMPLETE METHODS ======
     
     def on_tab_key(self, event):
@@ -1237,8 +1254,7 @@ SELECT version();"""
                 self.is_fetching_tables = False
         
         # Start background fetch
-        thread = threading.Thread(target=fetch_in_background, daemon=True)
-        thread.start()
+        self._executor.submit(fetch_in_background)
     
     def update_table_cache(self, table_names: List[str]):
         """Update table names cache and show popup if needed"""
@@ -6,11 +6,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 import customtkinter as ctk
 from typing import Dict, Any, Callable, Optional
-import sys
-from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
 from utils.saved_queries import SavedQueriesManager
 from utils.saved_variables import SavedVariablesManager
 from utils.theme_manager import theme_manager
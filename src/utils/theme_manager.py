@@ -6,7 +6,7 @@ Handles loading and applying themes from JSON files
 import json
 import os
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 
 class ThemeManager:
@@ -17,6 +17,9 @@ class ThemeManager:
         self.theme_name: str = ""
         self.available_themes: Dict[str, Dict] = {}
         
+        # Resolved colors for the current theme, keyed by (color_path, fallback)
+        self._color_cache: Dict[Tuple[str, str], str] = {}
+        
         # Look for themes directory at project root level
         self.themes_dir = Path(__file__).parent.parent.parent / "themes"
         self.themes_dir.mkdir(exist_ok=True)
@@ -61,6 +64,7 @@ class ThemeManager:
         if theme_name in self.available_themes:
             self.current_theme = self.available_themes[theme_name]['data']
             self.theme_name = theme_name
+            self._color_cache.clear()
             print(f"✓ Set theme to: {self.available_themes[theme_name]['display_name']} ({theme_name})")
             return True
         
@@ -69,6 +73,7 @@ class ThemeManager:
             if available_name.lower() == theme_name.lower():
                 self.current_theme = self.available_themes[available_name]['data']
                 self.theme_name = available_name
+                self._color_cache.clear()
                 print(f"✓ Set theme to: {self.available_themes[available_name]['display_name']} ({available_name})")
                 return True
         
@@ -86,6 +91,14 @@ class ThemeManager:
         Returns:
             Color hex code as string
         """
+        key = (color_path, fallback)
+        color = self._color_cache.get(key)
+        if color is None:
+            color = self._color_cache[key] = self._resolve_color(color_path, fallback)
+        return color
+    
+    def _resolve_color(self, color_path: str, fallback: str) -> str:
+        """Look up a color in the current theme without caching"""
         if not self.current_theme:
             return self._get_fallback_color(color_path, fallback)
         
@@ -0,0 +1,81 @@
+"""
+Tests for the AI assistant's generated-query cache
+"""
+
+import pytest
+
+pytest.importorskip("google.generativeai")
+pytest.importorskip("sqlparse")
+
+from ai import assistant
+from config import Config
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeModel:
+    """Stands in for the Gemini model and counts generations"""
+    
+    def __init__(self, *args, **kwargs):
+        self.calls = 0
+    
+    def generate_content(self, prompt):
+        self.calls += 1
+        return FakeResponse("SELECT * FROM users;")
+
+
+@pytest.fixture
+def ai(monkeypatch, tmp_path):
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    monkeypatch.setattr(assistant.genai, "configure", lambda **kwargs: None)
+    monkeypatch.setattr(assistant.genai, "GenerativeModel", FakeModel)
+    monkeypatch.setattr(assistant, "AI_CACHE_FILE", tmp_path / "ai_query_cache.json")
+    monkeypatch.setattr(Config, "AI_CACHE_ENABLED", True)
+    return assistant.NeuronDBAI()
+
+
+def test_repeated_request_in_one_session_hits_cache(ai):
+    first = ai.generate_sql_query("show all users")
+    second = ai.generate_sql_query("Show all  users?")
+    
+    assert ai.model.calls == 1
+    assert not first.get('cached')
+    assert second['cached']
+    assert second['query'] == first['query']
+
+
+def test_follow_up_request_bypasses_cache(ai):
+    ai.generate_sql_query("show all users")
+    ai.generate_sql_query("sort them by name")
+    ai.generate_sql_query("sort them by name")
+    
+    assert ai.model.calls == 3
+
+
+def test_non_sql_reply_is_not_cached(ai, monkeypatch):
+    monkeypatch.setattr(FakeModel, "generate_content",
+                        lambda self, prompt: FakeResponse("Cannot generate a query: no such table"))
+    ai.generate_sql_query("show all unicorns")
+    
+    assert ai._query_cache == {}
+
+
+def test_cache_persists_across_sessions(ai):
+    ai.generate_sql_query("show all users")
+    
+    reopened = assistant.NeuronDBAI()
+    result = reopened.generate_sql_query("show all users")
+    
+    assert result['cached']
+    assert reopened.model.calls == 0
+
+
+def test_cache_file_with_non_object_json_is_ignored(ai):
+    assistant.AI_CACHE_FILE.write_text('["not", "a", "cache"]')
+    
+    reopened = assistant.NeuronDBAI()
+    
+    assert reopened._query_cache == {}
@@ -0,0 +1,44 @@
+"""
+Tests for the AI requests answered with canned SQL in the main window
+"""
+
+import pytest
+
+pytest.importorskip("customtkinter")
+pytest.importorskip("psycopg2")
+pytest.importorskip("pandas")
+
+from ui.main_window import _TRIVIAL_AI_PATTERNS
+
+
+def trivial_sql(user_input):
+    """Canned SQL for a request, or None when it would go to the model"""
+    for pattern, build_sql in _TRIVIAL_AI_PATTERNS:
+        match = pattern.match(user_input)
+        if match:
+            return build_sql(match)
+    return None
+
+
+@pytest.mark.parametrize("user_input, table", [
+    ("count users", "users"),
+    ("Count rows in public.orders?", "public.orders"),
+    ("count all rows from users", "users"),
+    ("count rows of rows", "rows"),
+    ("count allocations", "allocations"),
+])
+def test_count_requests_use_canned_sql(user_input, table):
+    assert trivial_sql(user_input) == f"SELECT COUNT(*) FROM {table};"
+
+
+@pytest.mark.parametrize("user_input", [
+    "count rows",
+    "count all",
+    "count all rows",
+    "count rows in",
+    "count records",
+    "count everything",
+    "count users by country",
+])
+def test_vague_count_requests_go_to_the_model(user_input):
+    assert trivial_sql(user_input) is None